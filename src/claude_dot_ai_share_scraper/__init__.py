@@ -5,11 +5,11 @@ Claude.ai share URL scraper package.
 __version__ = "0.1.0"
 
 from .main import cli
-from .scraper import ClaudeShareScraper
+from .scraper import ClaudeShareScraper, FetchResult
 from .parser import ConversationParser
 from .cache import CacheManager
 
-__all__ = ["cli", "ClaudeShareScraper", "ConversationParser", "CacheManager"]
+__all__ = ["cli", "ClaudeShareScraper", "FetchResult", "ConversationParser", "CacheManager"]
 
 
 def main() -> None:
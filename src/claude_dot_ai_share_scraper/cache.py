@@ -3,27 +3,113 @@ Cache management for Claude.ai share URL scraper.
 """
 
 import json
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Set
 
-from .utils import generate_cache_dir_name, hash_content
+# Fast JSON serialization (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Compressed raw HTML storage (optional)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from .utils import HASH_ALGORITHM, generate_cache_dir_name, hash_content
+
+# Index files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# zstd level for raw HTML - fast to encode while still shrinking HTML several-fold
+ZSTD_LEVEL = 3
+
+
+def _dump_json(data: Any, compact: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+    
+    Both serializers use the same layout for a given compact setting, so
+    orjson and the json module write equivalent JSON in the same shape.
+    
+    Args:
+        data: JSON-serializable data
+        compact: Leave out indentation and spaces after separators
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data) if compact else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write a file via a temporary sibling and rename so readers never see a torn write."""
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+
+
+def _load_json(raw: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+class ConversationSummary(NamedTuple):
+    """Lightweight view of a cached conversation for listings."""
+    share_id: str
+    title: str
+    date: Optional[str]
+    cached_at: Optional[str]
+    directory: str
 
 
 class CacheManager:
     """Manages caching of Claude share conversations in human-readable hierarchy."""
     
-    def __init__(self, cache_dir: str = "cache"):
+    INDEX_VERSION = "2.0"
+    ENTRY_FILENAME = "entry.json"
+    
+    def __init__(self, cache_dir: str = "cache", compress_html: bool = True):
         """
         Initialize cache manager.
         
+        The top-level index only maps share IDs to their directories; the
+        full entry for each conversation (title, URL, dates, file info)
+        lives in an entry.json sidecar inside the conversation directory.
+        
         Args:
             cache_dir: Root cache directory path
+            compress_html: Store raw HTML zstd-compressed as raw.html.zst
+                when zstandard is installed
         """
         self.cache_dir = Path(cache_dir)
         self.conversations_dir = self.cache_dir / "conversations"
         self.index_file = self.cache_dir / "index.json"
+        # Internal paths are joined as plain strings; Path objects are only
+        # built at the public API boundary
+        self._conv_root = str(self.conversations_dir)
+        self._index_file_str = str(self.index_file)
+        self.compress_html = compress_html and ZSTD_AVAILABLE
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if self.compress_html else None
+        self._dirty = False
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty_entries: Set[str] = set()
+        self._created_dirs: Set[str] = set()
         
         # Ensure directories exist
         self.cache_dir.mkdir(exist_ok=True)
@@ -31,32 +117,180 @@ class CacheManager:
         
         # Load or initialize index
         self.index = self._load_index()
+        self._convs: Dict[str, Dict[str, Any]] = self.index.setdefault("conversations", {})
+        self._migrate_index()
+        self._init_stats()
     
     def _load_index(self) -> Dict[str, Any]:
         """Load cache index from file."""
-        if self.index_file.exists():
+        if os.path.exists(self._index_file_str):
             try:
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                if ORJSON_AVAILABLE and os.path.getsize(self._index_file_str) > MMAP_THRESHOLD:
+                    # Parse straight from the page cache to avoid copying large indexes
+                    with open(self._index_file_str, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                            memoryview(mm) as view:
+                        return orjson.loads(view)
+                with open(self._index_file_str, 'rb') as f:
+                    return _load_json(f.read())
+            except (ValueError, IOError):
                 pass
         
         # Return default index structure
         return {
-            "version": "1.0",
+            "version": self.INDEX_VERSION,
             "conversations": {},
             "last_updated": datetime.now().isoformat()
         }
     
+    def _migrate_index(self) -> None:
+        """Move full entries from a version 1.0 index into entry.json sidecars."""
+        for share_id, entry in self._convs.items():
+            if "files" not in entry:
+                continue
+            self._entries[share_id] = dict(entry)
+            self._dirty_entries.add(share_id)
+            self._convs[share_id] = {"directory": entry["directory"]}
+            self._mark_updated()
+        
+        if self.index.get("version") != self.INDEX_VERSION:
+            self.index["version"] = self.INDEX_VERSION
+            self._mark_updated()
+    
+    def _init_stats(self) -> None:
+        """Compute running cache totals with one full scan if the index lacks them."""
+        if "stats" in self.index:
+            return
+        
+        self.index["stats"] = {
+            "total_size": 0,
+            "file_counts": {"raw_html": 0, "metadata": 0, "markdown": 0}
+        }
+        self._load_entries(list(self._convs))
+        for share_id in self._convs:
+            for file_type, file_info in self._entries[share_id]["files"].items():
+                self._adjust_stats(file_type, file_info, 1)
+        self._mark_updated()
+    
+    def _adjust_stats(self, file_type: str, file_info: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a cached file from the running totals."""
+        stats = self.index["stats"]
+        stats["total_size"] += sign * file_info.get("size", 0)
+        if file_type in stats["file_counts"]:
+            stats["file_counts"][file_type] += sign
+        self._dirty = True
+    
+    def _set_file_info(self, share_id: str, file_type: str, file_info: Dict[str, Any]) -> None:
+        """Record a saved file in a conversation entry and the running totals."""
+        files = self._get_entry(share_id)["files"]
+        previous = files.get(file_type)
+        if previous is not None:
+            self._adjust_stats(file_type, previous, -1)
+        
+        files[file_type] = file_info
+        self._adjust_stats(file_type, file_info, 1)
+        self._dirty_entries.add(share_id)
+    
+    def _forget_files(self, share_id: str) -> None:
+        """Remove all files of a cached conversation from the running totals."""
+        for file_type, file_info in self._get_entry(share_id)["files"].items():
+            self._adjust_stats(file_type, file_info, -1)
+    
+    def _mark_updated(self, now_iso: Optional[str] = None) -> None:
+        """Mark the index dirty and stamp its last_updated time."""
+        self.index["last_updated"] = now_iso or datetime.now().isoformat()
+        self._dirty = True
+    
     def _save_index(self) -> None:
-        """Save cache index to file."""
-        self.index["last_updated"] = datetime.now().isoformat()
+        """Save cache index to file atomically via a temporary file."""
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(self.index, f, indent=2, ensure_ascii=False)
+            _atomic_write(self._index_file_str, _dump_json(self.index))
+            self._dirty = False
         except IOError as e:
             print(f"Warning: Could not save cache index: {e}")
     
+    def _conv_dir(self, share_id: str) -> Optional[str]:
+        """Get the conversation directory as a plain string, or None if not cached."""
+        entry = self._convs.get(share_id)
+        if entry is None:
+            return None
+        return os.path.join(self._conv_root, entry["directory"])
+    
+    def _require_conv_dir(self, share_id: str) -> str:
+        """Get the conversation directory, raising if the conversation is not cached."""
+        conv_dir = self._conv_dir(share_id)
+        if conv_dir is None:
+            raise ValueError(f"Conversation {share_id} not in cache")
+        return conv_dir
+    
+    def _entry_file(self, share_id: str) -> str:
+        """Get path to the entry.json sidecar of a conversation."""
+        directory = self._convs[share_id]["directory"]
+        return os.path.join(self._conv_root, directory, self.ENTRY_FILENAME)
+    
+    def _read_entry(self, share_id: str) -> Dict[str, Any]:
+        """Read a conversation entry from its sidecar file."""
+        try:
+            with open(self._entry_file(share_id), 'rb') as f:
+                return _load_json(f.read())
+        except (ValueError, IOError):
+            # Missing or unreadable sidecar - fall back to a bare entry
+            return {
+                "directory": self._convs[share_id]["directory"],
+                "title": "Untitled Conversation",
+                "url": "",
+                "date": None,
+                "cached_at": None,
+                "files": {}
+            }
+    
+    def _get_entry(self, share_id: str) -> Dict[str, Any]:
+        """Get a conversation entry, loading its sidecar on first access."""
+        entry = self._entries.get(share_id)
+        if entry is None:
+            entry = self._entries[share_id] = self._read_entry(share_id)
+        return entry
+    
+    def _load_entries(self, share_ids: List[str]) -> None:
+        """Load several conversation sidecars concurrently."""
+        missing = [share_id for share_id in share_ids if share_id not in self._entries]
+        if len(missing) < 2:
+            for share_id in missing:
+                self._get_entry(share_id)
+            return
+        
+        # Sidecar reads are I/O-bound, so overlap them with a small thread pool
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+            for share_id, entry in zip(missing, executor.map(self._read_entry, missing)):
+                self._entries[share_id] = entry
+    
+    def _save_entry(self, share_id: str) -> None:
+        """Write a conversation entry to its sidecar file atomically."""
+        try:
+            _atomic_write(self._entry_file(share_id), _dump_json(self._entries[share_id]))
+            self._dirty_entries.discard(share_id)
+        except IOError as e:
+            print(f"Warning: Could not save cache entry for {share_id}: {e}")
+    
+    def flush(self) -> None:
+        """Write pending conversation entries and the cache index to disk."""
+        for share_id in list(self._dirty_entries):
+            if share_id in self._convs:
+                self._save_entry(share_id)
+            else:
+                self._dirty_entries.discard(share_id)
+        
+        if self._dirty:
+            self._save_index()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - flush pending index changes."""
+        self.flush()
+    
     def conversation_exists(self, share_id: str) -> bool:
         """
         Check if conversation is already cached.
@@ -67,7 +301,7 @@ class CacheManager:
         Returns:
             True if conversation exists in cache
         """
-        return share_id in self.index["conversations"]
+        return share_id in self._convs
     
     def get_conversation_path(self, share_id: str) -> Optional[Path]:
         """
@@ -79,11 +313,8 @@ class CacheManager:
         Returns:
             Path to conversation directory or None if not cached
         """
-        if not self.conversation_exists(share_id):
-            return None
-            
-        entry = self.index["conversations"][share_id]
-        return self.conversations_dir / entry["directory"]
+        conv_dir = self._conv_dir(share_id)
+        return Path(conv_dir) if conv_dir is not None else None
     
     def create_conversation_entry(self, share_id: str, title: str, url: str, 
                                  conversation_date: Optional[datetime] = None) -> Path:
@@ -99,28 +330,40 @@ class CacheManager:
         Returns:
             Path to created conversation directory
         """
+        now = datetime.now()
         if conversation_date is None:
-            conversation_date = datetime.now()
+            conversation_date = now
         
         # Generate human-readable directory name
         dir_name = generate_cache_dir_name(title, share_id, conversation_date)
-        conv_dir = self.conversations_dir / dir_name
+        conv_dir = os.path.join(self._conv_root, dir_name)
         
-        # Create directory
-        conv_dir.mkdir(exist_ok=True)
+        # Create directory - skip the syscall for ones made earlier this session
+        if conv_dir not in self._created_dirs:
+            try:
+                os.mkdir(conv_dir)
+            except FileExistsError:
+                pass
+            self._created_dirs.add(conv_dir)
+        
+        # Re-creating an entry drops the files recorded for the old one
+        if share_id in self._convs:
+            self._forget_files(share_id)
         
-        # Add to index
-        self.index["conversations"][share_id] = {
+        # Add to index and write the full entry alongside the conversation
+        self._convs[share_id] = {"directory": dir_name}
+        self._entries[share_id] = {
             "directory": dir_name,
             "title": title,
             "url": url,
             "date": conversation_date.isoformat(),
-            "cached_at": datetime.now().isoformat(),
+            "cached_at": now.isoformat(),
             "files": {}
         }
         
-        self._save_index()
-        return conv_dir
+        self._dirty_entries.add(share_id)
+        self._mark_updated(now.isoformat())
+        return Path(conv_dir)
     
     def save_raw_html(self, share_id: str, html_content: str) -> Path:
         """
@@ -133,25 +376,74 @@ class CacheManager:
         Returns:
             Path to saved HTML file
         """
-        conv_dir = self.get_conversation_path(share_id)
-        if not conv_dir:
-            raise ValueError(f"Conversation {share_id} not in cache")
+        conv_dir = self._require_conv_dir(share_id)
+        data = html_content.encode('utf-8')
+        
+        if self._compressor is not None:
+            filename, stale = "raw.html.zst", "raw.html"
+            stored = self._compressor.compress(data)
+        else:
+            filename, stale = "raw.html", "raw.html.zst"
+            stored = data
+        
+        # Write the whole file in a single call
+        html_file = os.path.join(conv_dir, filename)
+        with open(html_file, 'wb') as f:
+            f.write(stored)
+        
+        # Drop a copy left behind by a save with the other compression setting
+        try:
+            os.remove(os.path.join(conv_dir, stale))
+        except FileNotFoundError:
+            pass
+        
+        # Update entry, reusing one timestamp for the file and the index.
+        # The hash covers the uncompressed HTML so it identifies the content.
+        now_iso = datetime.now().isoformat()
+        file_info = {
+            "filename": filename,
+            "size": len(stored),
+            "hash": hash_content(data),
+            "hash_algo": HASH_ALGORITHM,
+            "saved_at": now_iso
+        }
+        if self._compressor is not None:
+            file_info["compression"] = "zstd"
+        self._set_file_info(share_id, "raw_html", file_info)
+        self._mark_updated(now_iso)
         
-        html_file = conv_dir / "raw.html"
+        return Path(html_file)
+    
+    def load_raw_html(self, share_id: str) -> Optional[str]:
+        """
+        Load cached raw HTML, decompressing it if it was stored compressed.
         
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        Args:
+            share_id: Claude share ID
+            
+        Returns:
+            Raw HTML content or None if not cached
+        """
+        conv_dir = self._conv_dir(share_id)
+        if conv_dir is None:
+            return None
         
-        # Update index
-        self.index["conversations"][share_id]["files"]["raw_html"] = {
-            "filename": "raw.html",
-            "size": len(html_content),
-            "hash": hash_content(html_content),
-            "saved_at": datetime.now().isoformat()
-        }
+        file_info = self._get_entry(share_id)["files"].get("raw_html")
+        if file_info is None:
+            return None
         
-        self._save_index()
-        return html_file
+        try:
+            with open(os.path.join(conv_dir, file_info["filename"]), 'rb') as f:
+                data = f.read()
+        except IOError:
+            return None
+        
+        if file_info.get("compression") == "zstd":
+            if not ZSTD_AVAILABLE:
+                print(f"Warning: zstandard is required to read cached HTML for {share_id}")
+                return None
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode('utf-8')
     
     def save_metadata(self, share_id: str, metadata: Dict[str, Any]) -> Path:
         """
@@ -164,26 +456,25 @@ class CacheManager:
         Returns:
             Path to saved metadata file
         """
-        conv_dir = self.get_conversation_path(share_id)
-        if not conv_dir:
-            raise ValueError(f"Conversation {share_id} not in cache")
-        
-        metadata_file = conv_dir / "metadata.json"
+        metadata_file = os.path.join(self._require_conv_dir(share_id), "metadata.json")
         
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        # Encode once and reuse the bytes for writing, sizing and hashing
+        data = _dump_json(metadata, compact=True)
+        with open(metadata_file, 'wb') as f:
+            f.write(data)
         
-        # Update index
-        metadata_str = json.dumps(metadata)
-        self.index["conversations"][share_id]["files"]["metadata"] = {
+        # Update entry, reusing one timestamp for the file and the index
+        now_iso = datetime.now().isoformat()
+        self._set_file_info(share_id, "metadata", {
             "filename": "metadata.json",
-            "size": len(metadata_str),
-            "hash": hash_content(metadata_str),
-            "saved_at": datetime.now().isoformat()
-        }
-        
-        self._save_index()
-        return metadata_file
+            "size": len(data),
+            "hash": hash_content(data),
+            "hash_algo": HASH_ALGORITHM,
+            "saved_at": now_iso
+        })
+        self._mark_updated(now_iso)
+        
+        return Path(metadata_file)
     
     def save_markdown(self, share_id: str, markdown_content: str) -> Path:
         """
@@ -196,25 +487,53 @@ class CacheManager:
         Returns:
             Path to saved markdown file
         """
-        conv_dir = self.get_conversation_path(share_id)
-        if not conv_dir:
-            raise ValueError(f"Conversation {share_id} not in cache")
-        
-        md_file = conv_dir / "conversation.md"
+        md_file = os.path.join(self._require_conv_dir(share_id), "conversation.md")
         
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        # Encode once and write the whole file in a single call
+        data = markdown_content.encode('utf-8')
+        with open(md_file, 'wb') as f:
+            f.write(data)
         
-        # Update index
-        self.index["conversations"][share_id]["files"]["markdown"] = {
+        # Update entry, reusing one timestamp for the file and the index
+        now_iso = datetime.now().isoformat()
+        self._set_file_info(share_id, "markdown", {
             "filename": "conversation.md",
-            "size": len(markdown_content),
-            "hash": hash_content(markdown_content),
-            "saved_at": datetime.now().isoformat()
-        }
+            "size": len(data),
+            "hash": hash_content(data),
+            "hash_algo": HASH_ALGORITHM,
+            "saved_at": now_iso
+        })
+        self._mark_updated(now_iso)
+        
+        return Path(md_file)
+    
+    def save_all(self, share_id: str, title: str, url: str,
+                 conversation_date: Optional[datetime], html_content: str,
+                 metadata: Dict[str, Any], markdown_content: Optional[str] = None) -> Path:
+        """
+        Create a conversation entry and save all of its files with one flush.
         
-        self._save_index()
-        return md_file
+        Args:
+            share_id: Claude share ID
+            title: Conversation title
+            url: Original share URL
+            conversation_date: Date of conversation (defaults to now)
+            html_content: Raw HTML content
+            metadata: Metadata dictionary
+            markdown_content: Formatted markdown content, skipped if None
+            
+        Returns:
+            Path to conversation directory
+        """
+        conv_dir = self.create_conversation_entry(share_id, title, url, conversation_date)
+        self.save_raw_html(share_id, html_content)
+        self.save_metadata(share_id, metadata)
+        if markdown_content is not None:
+            self.save_markdown(share_id, markdown_content)
+        
+        # Write the entry sidecar and the index once for the whole record
+        self.flush()
+        return conv_dir
     
     def get_cached_conversations(self) -> List[Dict[str, Any]]:
         """
@@ -223,71 +542,115 @@ class CacheManager:
         Returns:
             List of conversation info dictionaries
         """
+        share_ids = list(self._convs)
+        self._load_entries(share_ids)
+        
         conversations = []
-        for share_id, entry in self.index["conversations"].items():
+        for share_id in share_ids:
+            entry = self._entries[share_id]
             conversations.append({
                 "share_id": share_id,
                 "title": entry["title"],
                 "url": entry["url"],
                 "date": entry["date"],
                 "cached_at": entry["cached_at"],
-                "directory": entry["directory"],
+                "directory": self._convs[share_id]["directory"],
                 "files": list(entry["files"].keys())
             })
         
         return conversations
     
+    def iter_conversations_lite(self) -> Iterator[ConversationSummary]:
+        """
+        Iterate over cached conversations without building full entry dicts.
+        
+        Sidecars that are not already in memory are read concurrently and
+        are not kept around afterwards, which keeps read-only commands
+        like list-cache light on memory.
+        
+        Yields:
+            ConversationSummary for each cached conversation
+        """
+        share_ids = list(self._convs)
+        
+        def read(share_id: str) -> Dict[str, Any]:
+            return self._entries.get(share_id) or self._read_entry(share_id)
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for share_id, entry in zip(share_ids, executor.map(read, share_ids)):
+                yield ConversationSummary(
+                    share_id,
+                    entry["title"],
+                    entry["date"],
+                    entry["cached_at"],
+                    self._convs[share_id]["directory"]
+                )
+    
+    def _has_content_files(self, conv_dir: str) -> bool:
+        """Check if a conversation directory holds anything besides its sidecar."""
+        try:
+            # scandir stops at the first hit without building Path objects
+            with os.scandir(conv_dir) as it:
+                return any(entry.name != self.ENTRY_FILENAME for entry in it)
+        except FileNotFoundError:
+            return False
+    
     def cleanup_empty_directories(self) -> int:
         """
         Remove empty conversation directories and orphaned index entries.
         
+        A directory holding nothing but its entry.json sidecar counts as empty.
+        
         Returns:
             Number of directories cleaned up
         """
         cleaned = 0
         to_remove = []
         
-        for share_id, entry in self.index["conversations"].items():
-            conv_dir = self.conversations_dir / entry["directory"]
+        for share_id, entry in self._convs.items():
+            conv_dir = os.path.join(self._conv_root, entry["directory"])
             
-            # Check if directory exists and has files
-            if not conv_dir.exists() or not any(conv_dir.iterdir()):
+            # Check if directory exists and has files besides the sidecar
+            if not self._has_content_files(conv_dir):
                 to_remove.append(share_id)
-                if conv_dir.exists():
-                    conv_dir.rmdir()
+                self._forget_files(share_id)
+                try:
+                    os.remove(os.path.join(conv_dir, self.ENTRY_FILENAME))
+                except FileNotFoundError:
+                    pass
+                try:
+                    os.rmdir(conv_dir)
+                except FileNotFoundError:
+                    pass
+                self._created_dirs.discard(conv_dir)
                 cleaned += 1
         
         # Remove from index
         for share_id in to_remove:
-            del self.index["conversations"][share_id]
+            del self._convs[share_id]
+            self._entries.pop(share_id, None)
+            self._dirty_entries.discard(share_id)
         
         if to_remove:
-            self._save_index()
+            self._mark_updated()
         
         return cleaned
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
-        Get cache statistics.
+        Get cache statistics from the running totals kept in the index.
         
         Returns:
             Dictionary with cache statistics
         """
-        total_conversations = len(self.index["conversations"])
-        total_size = 0
-        file_counts = {"raw_html": 0, "metadata": 0, "markdown": 0}
-        
-        for entry in self.index["conversations"].values():
-            for file_type, file_info in entry["files"].items():
-                total_size += file_info.get("size", 0)
-                if file_type in file_counts:
-                    file_counts[file_type] += 1
+        stats = self.index["stats"]
+        total_size = stats["total_size"]
         
         return {
-            "total_conversations": total_conversations,
+            "total_conversations": len(self._convs),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "file_counts": file_counts,
+            "file_counts": dict(stats["file_counts"]),
             "cache_directory": str(self.cache_dir),
             "last_updated": self.index.get("last_updated")
-        }
\ No newline at end of file
+        }
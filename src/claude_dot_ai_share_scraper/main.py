@@ -2,29 +2,60 @@
 Main CLI interface for Claude.ai share URL scraper.
 """
 
+import atexit
+import logging
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Optional
+from queue import SimpleQueue
+from typing import List, Optional, Tuple
 
 import click
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .scraper import ClaudeShareScraper
 from .parser import ConversationParser
 from .cache import CacheManager
-from .utils import is_valid_claude_share_url, extract_share_id
+from .utils import is_valid_claude_share_url, extract_share_id, match_share_url
 
 
 console = Console()
 
 
+def _configure_logging(verbose: bool) -> None:
+    """
+    Send the package's log records to the console from a background thread.
+    
+    Worker threads only enqueue records, so scraper progress messages never
+    wait on terminal output.
+    
+    Args:
+        verbose: Also show per-step debug messages
+    """
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, RichHandler(console=console, show_time=False, show_path=False))
+    listener.start()
+    atexit.register(listener.stop)
+    
+    package_logger = logging.getLogger(__package__)
+    package_logger.addHandler(QueueHandler(log_queue))
+    package_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    package_logger.propagate = False
+
+
 @click.group()
 @click.version_option()
-def cli():
+@click.option('--verbose', '-v', is_flag=True, help='Show detailed scraper progress')
+def cli(verbose: bool):
     """Claude.ai share URL scraper - Download and parse conversations into markdown."""
-    pass
+    _configure_logging(verbose)
 
 
 @cli.command()
@@ -41,8 +72,13 @@ def cli():
               help='Force re-download even if cached')
 @click.option('--no-markdown', is_flag=True,
               help='Skip markdown generation (download HTML only)')
+@click.option('--no-compress', is_flag=True,
+              help='Store raw HTML uncompressed (useful for debugging)')
+@click.option('--show-browser', is_flag=True,
+              help='Show the browser window when a browser fallback is used')
 def scrape(url: str, cache_dir: str, rate_limit: str, timeout: int, 
-           max_retries: int, force: bool, no_markdown: bool):
+           max_retries: int, force: bool, no_markdown: bool, no_compress: bool,
+           show_browser: bool):
     """Scrape a single Claude.ai share URL."""
     
     # Validate URL
@@ -61,7 +97,7 @@ def scrape(url: str, cache_dir: str, rate_limit: str, timeout: int,
     console.print(f"Processing share ID: {share_id}")
     
     # Initialize components
-    cache_manager = CacheManager(cache_dir)
+    cache_manager = CacheManager(cache_dir, compress_html=not no_compress)
     
     # Check if already cached
     if not force and cache_manager.conversation_exists(share_id):
@@ -83,7 +119,9 @@ def scrape(url: str, cache_dir: str, rate_limit: str, timeout: int,
         scraper = ClaudeShareScraper(
             rate_limit_delay=(min_delay, max_delay),
             timeout=timeout,
-            max_retries=max_retries
+            max_retries=max_retries,
+            cookie_jar_path=cache_manager.cache_dir / "cookies.json",
+            headless=not show_browser
         )
         
         # Use advanced method that tries all bypass techniques
@@ -91,16 +129,16 @@ def scrape(url: str, cache_dir: str, rate_limit: str, timeout: int,
         
         scraper.close()
         
-        if not result['success']:
+        if not result.success:
             progress.remove_task(task)
-            console.print(f"[red]Failed to download: {result['error']}[/red]")
+            console.print(f"[red]Failed to download: {result.error}[/red]")
             sys.exit(1)
         
         progress.update(task, description="Parsing HTML content...")
         
         # Parse HTML
         parser = ConversationParser()
-        parsed_data = parser.parse_html(result['html_content'], url)
+        parsed_data = parser.parse_html(result.html_content, url)
         
         if not parsed_data['success']:
             progress.remove_task(task)
@@ -113,31 +151,27 @@ def scrape(url: str, cache_dir: str, rate_limit: str, timeout: int,
         metadata = parsed_data['metadata']
         conversation_date = None
         if metadata.get('date'):
-            from datetime import datetime
             try:
                 conversation_date = datetime.fromisoformat(metadata['date'].replace('Z', '+00:00'))
-            except:
+            except (ValueError, TypeError):
                 pass
         
-        conv_dir = cache_manager.create_conversation_entry(
-            share_id=share_id,
-            title=metadata['title'],
-            url=url,
-            conversation_date=conversation_date
-        )
-        
-        # Save HTML
-        cache_manager.save_raw_html(share_id, result['html_content'])
-        
-        # Save metadata
-        cache_manager.save_metadata(share_id, metadata)
-        
-        # Generate and save markdown
+        # Generate markdown
+        markdown_content = None
         if not no_markdown:
             progress.update(task, description="Generating markdown...")
             markdown_content = parser.generate_markdown(parsed_data)
-            cache_manager.save_markdown(share_id, markdown_content)
         
+        # Save HTML, metadata and markdown with a single index write
+        conv_dir = cache_manager.save_all(
+            share_id=share_id,
+            title=metadata['title'],
+            url=url,
+            conversation_date=conversation_date,
+            html_content=result.html_content,
+            metadata=metadata,
+            markdown_content=markdown_content
+        )
         progress.remove_task(task)
     
     console.print("[green]Successfully scraped conversation![/green]")
@@ -160,8 +194,15 @@ def scrape(url: str, cache_dir: str, rate_limit: str, timeout: int,
               help='Force re-download even if cached')
 @click.option('--continue-on-error', is_flag=True,
               help='Continue processing other URLs if one fails')
+@click.option('--workers', '-w', default=4,
+              help='Number of URLs to process concurrently (default: 4)')
+@click.option('--no-compress', is_flag=True,
+              help='Store raw HTML uncompressed (useful for debugging)')
+@click.option('--show-browser', is_flag=True,
+              help='Show the browser window when a browser fallback is used')
 def batch(file_path: str, cache_dir: str, rate_limit: str, timeout: int,
-          max_retries: int, force: bool, continue_on_error: bool):
+          max_retries: int, force: bool, continue_on_error: bool, workers: int,
+          no_compress: bool, show_browser: bool):
     """Scrape multiple URLs from a text file (one URL per line)."""
     
     # Parse rate limit
@@ -179,11 +220,12 @@ def batch(file_path: str, cache_dir: str, rate_limit: str, timeout: int,
         console.print(f"[red]Error reading file: {e}[/red]")
         sys.exit(1)
     
-    # Filter valid URLs
+    # Filter valid URLs, extracting each share ID with the same match
     valid_urls = []
     for url in urls:
-        if is_valid_claude_share_url(url):
-            valid_urls.append(url)
+        share_id = match_share_url(url)
+        if share_id:
+            valid_urls.append((url, share_id))
         else:
             console.print(f"[yellow]Skipping invalid URL: {url}[/yellow]")
     
@@ -194,85 +236,120 @@ def batch(file_path: str, cache_dir: str, rate_limit: str, timeout: int,
     console.print(f"Processing {len(valid_urls)} URLs...")
     
     # Initialize components
-    cache_manager = CacheManager(cache_dir)
+    cache_manager = CacheManager(cache_dir, compress_html=not no_compress)
     scraper = ClaudeShareScraper(
         rate_limit_delay=(min_delay, max_delay),
         timeout=timeout,
-        max_retries=max_retries
+        max_retries=max_retries,
+        cookie_jar_path=cache_manager.cache_dir / "cookies.json",
+        headless=not show_browser
     )
-    parser = ConversationParser()
+    cache_lock = threading.Lock()
+    
+    def process_url(url: str, share_id: str) -> Tuple[bool, str]:
+        """Fetch, parse and cache one URL, returning (success, status message)."""
+        # Scrape conversation using advanced method with all bypass techniques
+        result = scraper.fetch_conversation_advanced(url)
+        
+        if not result.success:
+            return False, f"[red]Failed {share_id[:8]}: {result.error}[/red]"
+        
+        # Parse HTML - parsers keep per-document state, so use one per URL
+        parser = ConversationParser()
+        parsed_data = parser.parse_html(result.html_content, url)
+        
+        if not parsed_data['success']:
+            return False, f"[red]Parse error {share_id[:8]}: {parsed_data['error']}[/red]"
+        
+        metadata = parsed_data['metadata']
+        conversation_date = None
+        if metadata.get('date'):
+            try:
+                conversation_date = datetime.fromisoformat(metadata['date'].replace('Z', '+00:00'))
+            except (ValueError, TypeError):
+                pass
+        
+        markdown_content = parser.generate_markdown(parsed_data)
+        
+        # Save to cache - the cache manager is shared between workers
+        with cache_lock:
+            cache_manager.save_all(
+                share_id=share_id,
+                title=metadata['title'],
+                url=url,
+                conversation_date=conversation_date,
+                html_content=result.html_content,
+                metadata=metadata,
+                markdown_content=markdown_content
+            )
+        
+        return True, f"[green]Saved: {metadata['title'][:50]}...[/green]"
     
     success_count = 0
     error_count = 0
     
-    # Process URLs
-    with Progress(console=console) as progress:
+    # Process URLs - downloads are network-bound, so overlap them in a thread pool
+    with cache_manager, Progress(console=console) as progress:
         task = progress.add_task("Processing URLs...", total=len(valid_urls))
         
-        for i, url in enumerate(valid_urls):
-            share_id = extract_share_id(url)
-            progress.update(task, description=f"Processing {i+1}/{len(valid_urls)}: {share_id[:8]}...")
+        pending = {}
+        skipped = 0
+        executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(valid_urls))))
+        
+        for url, share_id in valid_urls:
+            # Check if already cached
+            if not force and cache_manager.conversation_exists(share_id):
+                console.print(f"Skipping cached: {share_id[:8]}")
+                skipped += 1
+                continue
             
+            pending[executor.submit(process_url, url, share_id)] = share_id
+        
+        # Account for cache hits in one step rather than re-rendering per URL
+        success_count += skipped
+        progress.advance(task, skipped)
+        
+        def report(future) -> bool:
+            """Print a finished URL's outcome, advance the bar and return whether it succeeded."""
+            share_id = pending[future]
             try:
-                # Check if already cached
-                if not force and cache_manager.conversation_exists(share_id):
-                    console.print(f"Skipping cached: {share_id[:8]}")
-                    success_count += 1
-                    continue
+                success, message = future.result()
+            except Exception as e:
+                success, message = False, f"[red]Unexpected error {share_id[:8]}: {e}[/red]"
+            
+            console.print(message)
+            progress.advance(task)
+            return success
+        
+        reported = set()
+        try:
+            last_ui_update = 0.0
+            for done, future in enumerate(as_completed(pending), 1):
+                reported.add(future)
                 
-                # Scrape conversation using advanced method with all bypass techniques
-                result = scraper.fetch_conversation_advanced(url)
+                # Throttle description churn to ~10 redraws per second
+                now = time.monotonic()
+                if now - last_ui_update > 0.1 or done == len(pending):
+                    progress.update(task, description=f"Processing {done}/{len(pending)}: {pending[future][:8]}...")
+                    last_ui_update = now
                 
-                if not result['success']:
-                    console.print(f"[red]Failed {share_id[:8]}: {result['error']}[/red]")
-                    if not continue_on_error:
-                        break
+                if report(future):
+                    success_count += 1
+                else:
                     error_count += 1
-                    continue
-                
-                # Parse HTML
-                parsed_data = parser.parse_html(result['html_content'], url)
-                
-                if not parsed_data['success']:
-                    console.print(f"[red]Parse error {share_id[:8]}: {parsed_data['error']}[/red]")
                     if not continue_on_error:
                         break
+        finally:
+            # Drop queued URLs after a fatal error; in-flight ones finish normally
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        # URLs that were in flight at a fatal error still ran and were saved
+        for future in pending:
+            if future not in reported and not future.cancelled():
+                if report(future):
+                    success_count += 1
+                else:
                     error_count += 1
-                    continue
-                
-                # Save to cache
-                metadata = parsed_data['metadata']
-                conversation_date = None
-                if metadata.get('date'):
-                    from datetime import datetime
-                    try:
-                        conversation_date = datetime.fromisoformat(metadata['date'].replace('Z', '+00:00'))
-                    except:
-                        pass
-                
-                conv_dir = cache_manager.create_conversation_entry(
-                    share_id=share_id,
-                    title=metadata['title'],
-                    url=url,
-                    conversation_date=conversation_date
-                )
-                
-                cache_manager.save_raw_html(share_id, result['html_content'])
-                cache_manager.save_metadata(share_id, metadata)
-                
-                markdown_content = parser.generate_markdown(parsed_data)
-                cache_manager.save_markdown(share_id, markdown_content)
-                
-                console.print(f"[green]Saved: {metadata['title'][:50]}...[/green]")
-                success_count += 1
-                
-            except Exception as e:
-                console.print(f"[red]Unexpected error {share_id[:8]}: {e}[/red]")
-                if not continue_on_error:
-                    break
-                error_count += 1
-            
-            progress.advance(task)
     
     scraper.close()
     
@@ -286,7 +363,7 @@ def list_cache(cache_dir: str):
     """List all cached conversations."""
     
     cache_manager = CacheManager(cache_dir)
-    conversations = cache_manager.get_cached_conversations()
+    conversations = list(cache_manager.iter_conversations_lite())
     
     if not conversations:
         console.print("[yellow]No cached conversations found[/yellow]")
@@ -300,15 +377,15 @@ def list_cache(cache_dir: str):
     table.add_column("Directory", style="yellow")
     
     for conv in conversations:
-        title = conv['title'][:50] + "..." if len(conv['title']) > 50 else conv['title']
-        date_str = conv['date'][:10] if conv['date'] else 'Unknown'
+        title = conv.title[:50] + "..." if len(conv.title) > 50 else conv.title
+        date_str = conv.date[:10] if conv.date else 'Unknown'
         
         table.add_row(
-            conv['share_id'][:8],
+            conv.share_id[:8],
             title,
             date_str,
-            str(conv.get('message_count', '?')),
-            conv['directory']
+            '?',
+            conv.directory
         )
     
     console.print(table)
@@ -346,8 +423,8 @@ def cleanup(cache_dir: str, yes: bool):
         if not click.confirm("This will remove empty cache directories. Continue?"):
             return
     
-    cache_manager = CacheManager(cache_dir)
-    cleaned = cache_manager.cleanup_empty_directories()
+    with CacheManager(cache_dir) as cache_manager:
+        cleaned = cache_manager.cleanup_empty_directories()
     
     if cleaned > 0:
         console.print(f"[green]Cleaned up {cleaned} empty directories[/green]")
@@ -399,19 +476,19 @@ def debug_browser(url: str):
     console.print("Note: First run may take longer as ChromeDriver downloads...")
     
     try:
-        scraper = ClaudeShareScraper()
+        scraper = ClaudeShareScraper(headless=False)
         result = scraper.fetch_conversation_with_browser(url)
         scraper.close()
         
-        if result['success']:
-            console.print(f"[green]Success! Content length: {len(result['html_content'])}[/green]")
+        if result.success:
+            console.print(f"[green]Success! Content length: {len(result.html_content)}[/green]")
             # Quick check if we have actual conversation content
-            if 'message' in result['html_content'].lower():
+            if 'message' in result.html_content.lower():
                 console.print("[green]✓ Found message content in HTML[/green]")
             else:
                 console.print("[yellow]⚠ No message content found - may still be loading page[/yellow]")
         else:
-            console.print(f"[red]Failed: {result['error']}[/red]")
+            console.print(f"[red]Failed: {result.error}[/red]")
             
     except Exception as e:
         console.print(f"[red]Exception: {e}[/red]")
@@ -427,20 +504,20 @@ def debug_seleniumbase(url: str):
     console.print("Note: This will open a visible browser window...")
     
     try:
-        scraper = ClaudeShareScraper()
+        scraper = ClaudeShareScraper(headless=False)
         result = scraper.fetch_conversation_with_seleniumbase_uc(url)
         scraper.close()
         
-        if result['success']:
-            console.print(f"[green]Success! Content length: {len(result['html_content'])}[/green]")
+        if result.success:
+            console.print(f"[green]Success! Content length: {len(result.html_content)}[/green]")
             # Quick check for conversation content
-            content_lower = result['html_content'].lower()
+            content_lower = result.html_content.lower()
             if 'message' in content_lower or 'conversation' in content_lower:
                 console.print("[green]✓ Found conversation content in HTML[/green]")
             else:
                 console.print("[yellow]⚠ No conversation content found[/yellow]")
         else:
-            console.print(f"[red]Failed: {result['error']}[/red]")
+            console.print(f"[red]Failed: {result.error}[/red]")
             
     except Exception as e:
         console.print(f"[red]Exception: {e}[/red]")
@@ -456,20 +533,20 @@ def debug_undetected(url: str):
     console.print("Note: This will open a visible browser window...")
     
     try:
-        scraper = ClaudeShareScraper()
+        scraper = ClaudeShareScraper(headless=False)
         result = scraper.fetch_conversation_with_undetected_chrome(url)
         scraper.close()
         
-        if result['success']:
-            console.print(f"[green]Success! Content length: {len(result['html_content'])}[/green]")
+        if result.success:
+            console.print(f"[green]Success! Content length: {len(result.html_content)}[/green]")
             # Quick check for conversation content
-            content_lower = result['html_content'].lower()
+            content_lower = result.html_content.lower()
             if 'message' in content_lower or 'conversation' in content_lower:
                 console.print("[green]✓ Found conversation content in HTML[/green]")
             else:
                 console.print("[yellow]⚠ No conversation content found[/yellow]")
         else:
-            console.print(f"[red]Failed: {result['error']}[/red]")
+            console.print(f"[red]Failed: {result.error}[/red]")
             
     except Exception as e:
         console.print(f"[red]Exception: {e}[/red]")
@@ -501,12 +578,12 @@ def debug_all_methods(url: str):
         try:
             result = method_func(url)
             
-            if result['success']:
-                content_len = len(result['html_content'])
-                has_conversation = 'message' in result['html_content'].lower()
+            if result.success:
+                content_len = len(result.html_content)
+                has_conversation = 'message' in result.html_content.lower()
                 status = f"✅ Success - {content_len} chars, conversation: {has_conversation}"
             else:
-                status = f"❌ Failed - {result['error']}"
+                status = f"❌ Failed - {result.error}"
                 
         except Exception as e:
             status = f"💥 Crashed - {str(e)}"
@@ -2,13 +2,171 @@
 HTML parser for Claude.ai share URLs to extract conversation content.
 """
 
+from __future__ import annotations
+
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from bs4 import BeautifulSoup, Tag, NavigableString
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Any
+
+# bs4 is imported where it is used so CLI startup does not pay for it
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
+# Fast C-based tree builder for BeautifulSoup (optional)
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 from .utils import extract_share_id, parse_iso_date, truncate_text
 
+# BeautifulSoup tree builder - lxml is several times faster than html.parser
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Inline script and style blocks, removed before BeautifulSoup builds the tree -
+# they make up most of a share page and nothing is extracted from them
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+
+# Precompiled patterns used on every parse
+_TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*Claude.*$')
+_WS_RE = re.compile(r'\s+')
+_LINE_START_RE = re.compile(r'^', re.M)
+_LINE_BREAK_WS_RE = re.compile(r'\s*\n\s*')
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.M)
+_SEARCH_RE = re.compile(r'web search|search results|fetched|favicon', re.I)
+_TOOL_PATTERNS = [
+    (re.compile(r'Failed to fetch', re.I), 'Network Request'),
+    (re.compile(r'Analyzing|Examined|Investigating', re.I), 'Analysis'),
+    (re.compile(r'Probed|Pondered', re.I), 'Thinking Process')
+]
+
+# Fixed top of every generated markdown file; date_line is empty or ends in a newline
+_MARKDOWN_HEADER = """# {title}
+
+## Conversation Details
+
+- **URL**: {url}
+- **Share ID**: {share_id}
+{date_line}- **Messages**: {count}
+- **Parsed**: {parsed_at}
+
+## Conversation
+"""
+
+# Artifact containers (.artifact, .code-artifact, .document-artifact,
+# [data-artifact], .attachment) in the order they are reported
+_ARTIFACT_MATCHERS = [
+    lambda tag: _has_all(tag, 'artifact'),
+    lambda tag: _has_all(tag, 'code-artifact'),
+    lambda tag: _has_all(tag, 'document-artifact'),
+    lambda tag: tag.has_attr('data-artifact'),
+    lambda tag: _has_all(tag, 'attachment'),
+]
+
+# Timestamp layout used in the markdown details section
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+# Bare class names that name a code block's language
+_LANGUAGE_CLASSES = frozenset([
+    'python', 'javascript', 'java', 'cpp', 'csharp', 'go', 'rust', 'typescript'
+])
+
+# Content sniffing for unlabeled code blocks, checked in priority order
+_LANG_SNIFF = [
+    ('python', re.compile(r'\bdef |\bimport |\bpython\b', re.I)),
+    ('javascript', re.compile(r'\bfunction\b|\bconst |\blet |=>', re.I)),
+    ('sql', re.compile(r'\bSELECT\b[\s\S]{0,500}?\bFROM\b', re.I)),
+    ('cpp', re.compile(r'#include|std::|int\s+main'))
+]
+
+
+class _MessageTurn(NamedTuple):
+    """A message container found in the page, with the role known from how it was found."""
+    role: str
+    element: Tag
+    user_message: Optional[Tag]
+
+
+class _MessageScan(NamedTuple):
+    """Markers found in one walk over a message element's subtree."""
+    user_message: Optional[Tag]
+    has_avatar: bool
+    has_streaming: bool
+
+
+def _clean_code_text(code_text: str) -> str:
+    """
+    Strip trailing whitespace from each line of extracted code.
+    
+    Highlighting spans only wrap text, so a code element's get_text() already
+    is the code - no need to copy the subtree and unwrap the spans.
+    """
+    return _TRAILING_WS_RE.sub('', code_text)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(date_str: str) -> str:
+    """Format an ISO timestamp for display, or return it unchanged if it does not parse."""
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11
+    if date_str.endswith('Z'):
+        iso_str = date_str[:-1] + '+00:00'
+    else:
+        iso_str = date_str
+    try:
+        return datetime.fromisoformat(iso_str).strftime(_DATE_FORMAT)
+    except ValueError:
+        return date_str
+
+
+def _has_all(tag: Tag, *names: str) -> bool:
+    """Check that a tag carries every one of the given CSS classes."""
+    classes = tag.get('class')
+    return classes is not None and all(name in classes for name in names)
+
+
+def _has_any(tag: Tag, *names: str) -> bool:
+    """Check that a tag carries at least one of the given CSS classes."""
+    classes = tag.get('class')
+    return classes is not None and any(name in classes for name in names)
+
+
+def _find_child(tag: Tag, name: str) -> Optional[Tag]:
+    """Find the first direct child with the given tag name, without descending further."""
+    for child in tag.children:
+        if child.name == name:
+            return child
+    return None
+
+
+def _is_processed_block(tag: Tag) -> bool:
+    """Check for code blocks and artifacts, which are extracted separately from the text."""
+    return (tag.name == 'pre' or _has_any(tag, 'code-block', 'artifact') or
+            tag.has_attr('data-artifact'))
+
+
+def _find_div_with_classes(root: Tag, required: tuple, forbidden: tuple = ()) -> Optional[Tag]:
+    """
+    Find the first descendant div carrying all required and none of the forbidden classes.
+    
+    Walks descendants lazily and stops at the first match instead of
+    building a list of every div in the subtree.
+    """
+    for node in root.descendants:
+        if node.name != 'div':
+            continue
+        classes = node.get('class')
+        if (classes and all(name in classes for name in required) and
+                not any(name in classes for name in forbidden)):
+            return node
+    return None
+
+
+def _is_user_turn_container(tag: Tag) -> bool:
+    """Check for the rounded container Claude's UI wraps each user message in."""
+    return _has_all(tag, 'rounded-xl', 'bg-bg-300')
+
 
 class ConversationParser:
     """Parser for Claude.ai share page HTML to extract conversation data."""
@@ -19,6 +177,26 @@ class ConversationParser:
         self.title = None
         self.messages = []
         self.metadata = {}
+        
+        # Markdown formatters keyed by tag name, so formatting an element is
+        # one dict lookup rather than a walk down an if/elif chain
+        self._formatters = {
+            'p': self._format_text,
+            'strong': self._format_bold,
+            'b': self._format_bold,
+            'em': self._format_italic,
+            'i': self._format_italic,
+            'code': self._format_inline_code,
+            'pre': self._format_pre,
+            'a': self._format_link,
+            'ul': self._format_unordered_list,
+            'ol': self._format_ordered_list,
+            'blockquote': self._format_blockquote,
+            'table': self._format_table,
+            'div': self._format_div,
+        }
+        for level in range(1, 7):
+            self._formatters[f'h{level}'] = self._format_heading
     
     def parse_html(self, html_content: str, url: str) -> Dict[str, Any]:
         """
@@ -32,7 +210,7 @@ class ConversationParser:
             Dictionary containing parsed conversation data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = self._parse_without_scripts(html_content)
             
             # Extract share ID from URL
             self.share_id = extract_share_id(url)
@@ -69,25 +247,44 @@ class ConversationParser:
                 'error': f"Parsing error: {str(e)}"
             }
     
+    def _parse_without_scripts(self, html_content: str) -> BeautifulSoup:
+        """
+        Build a soup of a page without its inline script and style blocks.
+        
+        The blocks are cut out with a regex before parsing, so BeautifulSoup
+        never builds the script bundles that make up most of a share page,
+        while every title and message lookup still sees the elements it
+        would find in the full document.
+        
+        Args:
+            html_content: Raw HTML content
+            
+        Returns:
+            BeautifulSoup of the page without script and style elements
+        """
+        from bs4 import BeautifulSoup
+        
+        return BeautifulSoup(_SCRIPT_STYLE_RE.sub('', html_content), HTML_PARSER)
+    
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract conversation title from HTML."""
-        # Try various title selectors
-        title_selectors = [
-            '.truncate',  # Claude's current UI stores title in div with truncate class
-            'title',
-            'h1',
-            '[data-testid="chat-title"]',
-            '.chat-title',
-            '.conversation-title'
+        # Try various title lookups - plain find() avoids compiling CSS selectors
+        title_lookups = [
+            {'class_': 'truncate'},  # Claude's current UI stores title in div with truncate class
+            {'name': 'title'},
+            {'name': 'h1'},
+            {'attrs': {'data-testid': 'chat-title'}},
+            {'class_': 'chat-title'},
+            {'class_': 'conversation-title'}
         ]
         
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                title = element.get_text().strip()
+        for lookup in title_lookups:
+            element = soup.find(**lookup)
+            title = element.get_text().strip() if element else ''
+            if title:
                 # Clean up title
-                title = re.sub(r'\s*\|\s*Claude.*$', '', title)  # Remove "| Claude" suffix
-                title = re.sub(r'\s+', ' ', title)  # Normalize whitespace
+                title = _TITLE_SUFFIX_RE.sub('', title)  # Remove "| Claude" suffix
+                title = _WS_RE.sub(' ', title)  # Normalize whitespace
                 if title and title != 'Claude':
                     return title
         
@@ -109,17 +306,17 @@ class ConversationParser:
         conversation_container = None
         
         # Try to find the main conversation area
-        conversation_selectors = [
-            'main',
-            '[role="main"]',
-            '.conversation',
-            '.chat-container',
-            '#chat',
-            '.messages-container'
+        conversation_lookups = [
+            {'name': 'main'},
+            {'attrs': {'role': 'main'}},
+            {'class_': 'conversation'},
+            {'class_': 'chat-container'},
+            {'id': 'chat'},
+            {'class_': 'messages-container'}
         ]
         
-        for selector in conversation_selectors:
-            container = soup.select_one(selector)
+        for lookup in conversation_lookups:
+            container = soup.find(**lookup)
             if container:
                 conversation_container = container
                 break
@@ -132,249 +329,69 @@ class ConversationParser:
         message_elements = self._find_message_turns(conversation_container)
         
         # Parse each message turn
-        for i, element in enumerate(message_elements):
-            message = self._parse_message_element(element, i)
+        for i, turn in enumerate(message_elements):
+            message = self._parse_message_element(turn.element, i, turn.role, turn.user_message)
             if message and message['content'].strip():
                 messages.append(message)
         
         return messages
         
-    def _find_message_turns(self, container: BeautifulSoup) -> List[Tag]:
+    def _find_message_turns(self, container: BeautifulSoup) -> List[_MessageTurn]:
         """Find individual message turns in the conversation using Claude.ai's specific structure."""
-        messages = []
         
-        # Find user messages: look for containers with the user message testid, then find their parent containers
-        user_containers = []
-        for user_msg in container.find_all(attrs={'data-testid': 'user-message'}):
-            # Find the parent container that has the rounded styling
-            parent = user_msg
-            for _ in range(10):  # Look up to find the styled container
-                if parent.parent:
-                    parent = parent.parent
-                    classes = parent.get('class', [])
-                    if classes and 'rounded-xl' in ' '.join(classes) and 'bg-bg-300' in ' '.join(classes):
-                        user_containers.append(parent)
-                        break
-                else:
-                    break
-        
-        # Find Claude responses: look for the streaming containers
-        claude_containers = []
-        for div in container.find_all('div', attrs={'data-is-streaming': 'false'}):
-            claude_containers.append(div)
-        
-        # Combine and sort by document order
-        all_containers = []
-        
-        for user_div in user_containers:
-            all_containers.append(('user', user_div, self._get_simple_position(user_div)))
+        # One walk over the tree in document order. Iterating descendants and
+        # reading attrs directly avoids find_all's per-node matcher overhead.
+        messages = []
+        seen = set()
+        for marker in container.descendants:
+            attrs = getattr(marker, 'attrs', None)
+            if not attrs:
+                continue
+            if attrs.get('data-testid') == 'user-message':
+                # Use the nearest ancestor container that has the rounded styling
+                element = marker.find_parent(_is_user_turn_container)
+                if element is None:
+                    continue
+                turn = _MessageTurn('human', element, marker)
+            elif attrs.get('data-is-streaming') == 'false' and marker.name == 'div':
+                # Claude's finished streaming containers
+                turn = _MessageTurn('assistant', marker, None)
+            else:
+                continue
             
-        for claude_div in claude_containers:
-            all_containers.append(('claude', claude_div, self._get_simple_position(claude_div)))
-        
-        # Sort by position to maintain conversation order
-        all_containers.sort(key=lambda x: x[2])
-        
-        # Return just the elements
-        return [container[1] for container in all_containers]
-    
-    def _get_simple_position(self, element: Tag) -> int:
-        """Get a simple position indicator for sorting based on document order."""
-        # Find this element's position by counting preceding elements
-        position = 0
-        current = element
-        
-        # Count all elements that come before this one in document order
-        while current:
-            # Count preceding siblings
-            for sibling in current.previous_siblings:
-                if hasattr(sibling, 'name'):
-                    position += 1
-                    
-            # Move up to parent
-            current = current.parent
-            if current:
-                position += 1000  # Give significant weight to parent level
-        
-        return position
-    
-    def _calculate_content_richness(self, element: Tag, text: str) -> int:
-        """Calculate how rich/meaningful the content in this element is."""
-        score = 0
-        
-        # Check for code blocks (high value)
-        if element.find('pre') or element.find('code'):
-            score += 3
-        
-        # Check for structured content
-        if element.find(['ul', 'ol', 'table']):
-            score += 2
-        
-        # Check for substantial text
-        if len(text) > 500:
-            score += 2
-        elif len(text) > 200:
-            score += 1
-        
-        # Check for conversation patterns
-        if any(pattern in text.lower() for pattern in [
-            'what', 'how', 'why', 'can you', 'let me', 'here\'s', 'this is',
-            'looking at', 'i think', 'the quest', 'fascinating', 'brilliant'
-        ]):
-            score += 1
-        
-        # Check for technical content
-        if any(term in text.lower() for term in [
-            'function', 'algorithm', 'model', 'system', 'code', 'language',
-            'implementation', 'framework', 'api', 'data', 'analysis'
-        ]):
-            score += 1
-        
-        # Penalize very repetitive content
-        lines = text.split('\n')
-        unique_lines = set(line.strip() for line in lines if line.strip())
-        if len(lines) > 5 and len(unique_lines) / len(lines) < 0.3:
-            score -= 2
-        
-        return max(0, score)
-    
-    def _overlaps_with_selected(self, element: Tag, selected: List[Tag]) -> bool:
-        """Check if element overlaps with any already selected elements."""
-        for selected_element in selected:
-            # Check if one contains the other
-            if (element in selected_element.descendants or 
-                selected_element in element.descendants):
-                return True
-        return False
-    
-    def _looks_like_message_content(self, element: Tag, text: str) -> bool:
-        """Check if element looks like it contains message content."""
-        # Look for indicators of message content
-        message_indicators = [
-            # Check for code blocks
-            element.find('pre') is not None,
-            element.find('code') is not None,
-            # Check for question patterns
-            '?' in text and len(text) > 30,
-            # Check for substantial paragraphs
-            len(text) > 100,
-            # Check for numbered lists or bullets
-            any(pattern in text for pattern in ['1.', '2.', '•', '-', '*']),
-            # Check for common conversation starters
-            any(starter in text.lower() for starter in [
-                'what', 'how', 'why', 'when', 'where', 'can you', 'please',
-                'i think', 'let me', 'here\'s', 'this is', 'looking at'
-            ])
-        ]
-        
-        return any(message_indicators)
-    
-    def _is_nested_in_message(self, element: Tag, message_list: List[Tag]) -> bool:
-        """Check if element is nested inside an already identified message."""
-        for message in message_list:
-            if element in message.descendants:
-                return True
-        return False
-    
-    def _get_element_position(self, element: Tag) -> int:
-        """Get the position of element in document order."""
-        # Simple position calculation based on document order
-        position = 0
-        for el in element.parent.children if element.parent else []:
-            if el == element:
-                break
-            if hasattr(el, 'name'):
-                position += 1
-        return position
-    
-    def _get_element_position_in_document(self, element: Tag) -> int:
-        """Get the absolute position of element in the entire document."""
-        # Walk up to find all elements before this one in document order
-        position = 0
-        current = element
-        
-        # Find the root of the document
-        while current.parent:
-            # Count preceding siblings
-            for sibling in current.parent.children:
-                if sibling == current:
-                    break
-                if hasattr(sibling, 'name'):
-                    position += self._count_descendants(sibling)
-            current = current.parent
-        
-        return position
-    
-    def _count_descendants(self, element: Tag) -> int:
-        """Count all descendant elements."""
-        if not hasattr(element, 'descendants'):
-            return 1
-        count = 1
-        for desc in element.descendants:
-            if hasattr(desc, 'name'):
-                count += 1
-        return count
-    
-    def _find_alternating_content(self, soup: BeautifulSoup) -> List[Tag]:
-        """Find alternating conversation content when standard selectors fail."""
-        # Look for patterns that suggest conversation structure
-        content_blocks = []
-        
-        # Try to find main content area
-        main_selectors = ['main', '.main-content', '#main', '.chat-container', '.conversation']
-        main_element = None
-        
-        for selector in main_selectors:
-            element = soup.select_one(selector)
-            if element:
-                main_element = element
-                break
-        
-        if not main_element:
-            main_element = soup
+            # A styled container precedes its user message, so emitting it
+            # here keeps conversation order without sorting
+            if id(turn.element) not in seen:
+                seen.add(id(turn.element))
+                messages.append(turn)
         
-        # Look for div elements that might contain conversation content
-        potential_messages = main_element.find_all('div')
-        
-        # Filter for elements that look like messages (have substantial text content)
-        for div in potential_messages:
-            text = div.get_text().strip()
-            if len(text) > 20 and not self._is_ui_element(div):
-                content_blocks.append(div)
-        
-        return content_blocks
+        return messages
     
-    def _is_ui_element(self, element: Tag) -> bool:
-        """Check if element is likely a UI element rather than message content."""
-        # Check for common UI classes/attributes
-        ui_indicators = [
-            'button', 'nav', 'header', 'footer', 'sidebar', 'menu',
-            'toolbar', 'tooltip', 'modal', 'popup', 'loading'
-        ]
-        
-        class_str = ' '.join(element.get('class', [])).lower()
-        id_str = (element.get('id') or '').lower()
-        
-        for indicator in ui_indicators:
-            if indicator in class_str or indicator in id_str:
-                return True
-        
-        # Check if element has form controls
-        if element.find(['input', 'button', 'select', 'textarea']):
-            return True
+    def _parse_message_element(self, element: Tag, index: int, role: Optional[str] = None,
+                               user_message: Optional[Tag] = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse individual message element.
         
-        return False
-    
-    def _parse_message_element(self, element: Tag, index: int) -> Optional[Dict[str, Any]]:
-        """Parse individual message element."""
+        Args:
+            element: Message container element
+            index: Position of the message in the conversation
+            role: Role already known from how the container was found, if any
+            user_message: The container's user-message node, for human turns
+            
+        Returns:
+            Message dictionary or None if the element has no content
+        """
         if not element:
             return None
         
-        # Determine message role (human vs assistant)
-        role = self._determine_message_role(element, index)
+        if role is None:
+            # Unknown container - collect role markers in one walk and sniff the role
+            scan = self._scan_message(element)
+            role = self._determine_message_role(element, index, scan)
+            user_message = scan.user_message
         
         # Extract content
-        content = self._extract_message_content(element)
+        content = self._extract_message_content(element, user_message)
         
         if not content.strip():
             return None
@@ -386,51 +403,65 @@ class ConversationParser:
             'timestamp': None  # Could be extracted if available
         }
     
-    def _determine_message_role(self, element: Tag, index: int) -> str:
+    def _scan_message(self, element: Tag) -> _MessageScan:
+        """Walk a message subtree once, collecting the markers used to classify it."""
+        user_message = None
+        has_avatar = False
+        has_streaming = False
+        
+        for node in element.descendants:
+            if node.name is None:
+                continue
+            if node.get('data-testid') == 'user-message':
+                # Highest-priority marker - nothing else is needed once found
+                user_message = node
+                break
+            if node.get('data-is-streaming') == 'false':
+                has_streaming = True
+            if not has_avatar and node.name == 'div' and node.string == 'D':
+                has_avatar = True
+        
+        return _MessageScan(user_message, has_avatar, has_streaming)
+    
+    def _determine_message_role(self, element: Tag, index: int, scan: _MessageScan) -> str:
         """Determine if message is from human or assistant using Claude.ai specific structure."""
         # Check for specific Claude.ai data attributes
-        user_message = element.find(attrs={'data-testid': 'user-message'})
-        if user_message:
+        if scan.user_message is not None:
             return 'human'
             
         # Check for user avatar indicator (letter "D")
-        if element.find('div', string='D'):
+        if scan.has_avatar:
             return 'human'
         
         # Check for Claude response indicators by examining immediate children
-        for child in element.children:
-            if hasattr(child, 'get') and child.get('class'):
-                child_classes = child.get('class', [])
-                if 'font-claude-response' in child_classes:
-                    return 'assistant'
+        if self._find_response_div(element) is not None:
+            return 'assistant'
         
         # Also check deeper for data-is-streaming  
-        claude_response = element.find(attrs={'data-is-streaming': 'false'})
-        if claude_response:
+        if scan.has_streaming:
             return 'assistant'
         
         # Check class names for additional patterns
-        class_str = ' '.join(element.get('class', [])).lower()
-        if 'user-message' in class_str or 'human-message' in class_str:
+        if _has_any(element, 'user-message', 'human-message'):
             return 'human'
-        if 'claude-message' in class_str or 'assistant-message' in class_str:
+        if _has_any(element, 'claude-message', 'assistant-message'):
             return 'assistant'
         
-        # Check for text patterns
-        text = element.get_text().lower()
-        if text.startswith(('human:', 'user:', 'me:')):
+        # Check for text patterns - only the prefix matters, so skip
+        # lowercasing the whole message
+        prefix = element.get_text()[:16].lower()
+        if prefix.startswith(('human:', 'user:', 'me:')):
             return 'human'
-        if text.startswith(('claude:', 'assistant:', 'ai:')):
+        if prefix.startswith(('claude:', 'assistant:', 'ai:')):
             return 'assistant'
         
         # Default to alternating pattern (typically human starts)
         return 'human' if index % 2 == 0 else 'assistant'
     
-    def _extract_message_content(self, element: Tag) -> str:
+    def _extract_message_content(self, element: Tag, user_message_element: Optional[Tag]) -> str:
         """Extract and format message content as markdown."""
         # Check if this is a user message first
-        user_message_element = element.find(attrs={'data-testid': 'user-message'})
-        if user_message_element:
+        if user_message_element is not None:
             # For user messages, extract the content directly from the user-message element
             return user_message_element.get_text(strip=True)
         
@@ -449,59 +480,35 @@ class ConversationParser:
         
         return '\n\n'.join(content_parts).strip()
     
+    def _find_response_div(self, element: Tag) -> Optional[Tag]:
+        """Find the direct child holding Claude's response (font-claude-response)."""
+        for child in element.children:
+            if child.name is not None and _has_all(child, 'font-claude-response'):
+                return child
+        return None
+    
     def _extract_thinking_process(self, element: Tag) -> str:
         """Extract the thinking process content from the collapsible section."""
         # Find the font-claude-response container
-        claude_response_div = None
-        for child in element.children:
-            if hasattr(child, 'get') and child.get('class'):
-                if 'font-claude-response' in child.get('class', []):
-                    claude_response_div = child
-                    break
-        
-        if not claude_response_div:
+        claude_response_div = self._find_response_div(element)
+        if claude_response_div is None:
             return ""
         
         # Look for the thinking process container - it has p-3, pt-0, pr-8 classes
-        for div in claude_response_div.find_all('div'):
-            classes = div.get('class', [])
-            class_str = ' '.join(classes)
-            
-            if ('grid-cols-1' in class_str and 
-                'p-3' in class_str and 
-                'pt-0' in class_str and 
-                'pr-8' in class_str):
-                return self._extract_structured_content(div)
-        
-        return ""
+        div = _find_div_with_classes(claude_response_div, ('grid-cols-1', 'p-3', 'pt-0', 'pr-8'))
+        return self._extract_structured_content(div) if div is not None else ""
     
     def _extract_claude_main_response(self, element: Tag) -> str:
         """Extract Claude's main response content, preserving order and structure."""
         # Find the font-claude-response container
-        claude_response_div = None
-        for child in element.children:
-            if hasattr(child, 'get') and child.get('class'):
-                if 'font-claude-response' in child.get('class', []):
-                    claude_response_div = child
-                    break
-        
-        if not claude_response_div:
+        claude_response_div = self._find_response_div(element)
+        if claude_response_div is None:
             return ""
         
         # Look for the main response container - it has basic grid classes but NOT the padding classes
-        for div in claude_response_div.find_all('div'):
-            classes = div.get('class', [])
-            class_str = ' '.join(classes)
-            
-            # Main response has grid-cols-1 and gap-2.5 but NOT p-3/pt-0/pr-8
-            if ('grid-cols-1' in class_str and 
-                'gap-2.5' in class_str and
-                'p-3' not in class_str and
-                'pt-0' not in class_str and
-                'pr-8' not in class_str):
-                return self._extract_structured_content(div)
-        
-        return ""
+        div = _find_div_with_classes(claude_response_div, ('grid-cols-1', 'gap-2.5'),
+                                     forbidden=('p-3', 'pt-0', 'pr-8'))
+        return self._extract_structured_content(div) if div is not None else ""
     
     def _extract_structured_content(self, container: Tag) -> str:
         """Extract content from a container while preserving structure and order."""
@@ -520,17 +527,17 @@ class ConversationParser:
         """Extract artifacts and structured content."""
         artifacts = []
         
-        # Look for artifact containers or structured content
-        artifact_selectors = [
-            '.artifact',
-            '.code-artifact', 
-            '.document-artifact',
-            '[data-artifact]',
-            '.attachment'
-        ]
-        
-        for selector in artifact_selectors:
-            artifact_elements = element.select(selector)
+        # Look for artifact containers or structured content. One walk sorts
+        # matches into a bucket per selector instead of a select() per selector.
+        buckets = [[] for _ in _ARTIFACT_MATCHERS]
+        for node in element.descendants:
+            if node.name is None:
+                continue
+            for bucket, matches in zip(buckets, _ARTIFACT_MATCHERS):
+                if matches(node):
+                    bucket.append(node)
+        
+        for artifact_elements in buckets:
             for artifact in artifact_elements:
                 title = artifact.get('data-title') or artifact.get('title') or 'Artifact'
                 content = artifact.get_text(strip=True)
@@ -540,136 +547,75 @@ class ConversationParser:
         return artifacts
     
     def _extract_code_blocks(self, element: Tag) -> List[str]:
-        """Extract code blocks with proper formatting and Pygments highlighting."""
+        """Extract code blocks as fenced markdown with language labels."""
         code_blocks = []
         
         # Look for Claude's actual code block structure: <pre class="code-block__code"><code>
         code_pres = element.find_all('pre', class_='code-block__code')
         for code_pre in code_pres:
-            code_elem = code_pre.find('code')
+            code_elem = _find_child(code_pre, 'code')
             if code_elem:
                 # Extract clean code content without HTML styling
-                code_content = self._extract_clean_code_content(code_elem)
+                text = code_elem.get_text()
+                code_content = _clean_code_text(text)
                 
                 # Detect language from various sources
-                language = self._detect_code_language(code_elem)
+                language = self._detect_code_language(code_elem, text)
                 
-                # Apply Pygments highlighting if available
+                # Wrap in a fenced block labelled with the language
                 if code_content.strip():
-                    highlighted_code = self._apply_pygments_highlighting(code_content, language)
-                    code_blocks.append(highlighted_code)
+                    fenced_code = self._fence_code_block(code_content, language)
+                    code_blocks.append(fenced_code)
         
         # Fallback: Look for other code blocks
         if not code_blocks:
+            seen_snippets = set()
             fallback_selectors = ['pre code', 'code']
             for selector in fallback_selectors:
                 code_elements = element.select(selector)
                 for code_elem in code_elements:
-                    # Skip if already processed above
-                    if self._already_processed_code_block(code_elem, code_blocks):
-                        continue
-                        
                     # Skip inline code (short single-line code)
                     text = code_elem.get_text()
                     if len(text) < 20 or '\n' not in text:
                         continue
-                        
-                    code_content = self._extract_clean_code_content(code_elem)
-                    language = self._detect_code_language(code_elem)
+                    
+                    # Skip if already processed - compare the first 100 chars
+                    code_content = _clean_code_text(text)
+                    snippet = code_content[:100]
+                    if snippet in seen_snippets:
+                        continue
+                    seen_snippets.add(snippet)
+                    
+                    language = self._detect_code_language(code_elem, text)
                     
                     if code_content.strip():
-                        highlighted_code = self._apply_pygments_highlighting(code_content, language)
-                        code_blocks.append(highlighted_code)
+                        fenced_code = self._fence_code_block(code_content, language)
+                        code_blocks.append(fenced_code)
         
         return code_blocks
     
     def _is_language_indicator(self, element: Tag) -> bool:
         """Check if element is a language indicator div."""
-        classes = element.get('class', [])
-        class_str = ' '.join(classes)
-        
         # Claude uses: class="text-text-500 font-small p-3.5 pb-0"
-        return ('text-text-500' in class_str and 
-                'font-small' in class_str and 
-                'p-3.5' in class_str)
-    
-    def _extract_clean_code_content(self, code_elem: Tag) -> str:
-        """Extract clean code content, removing HTML styling but preserving structure."""
-        # Create a copy to avoid modifying original
-        elem_copy = code_elem.__copy__()
-        
-        # Remove all span elements but keep their text content
-        for span in elem_copy.find_all('span'):
-            span.replace_with(span.get_text())
-        
-        # Get the text and clean it up
-        code_text = elem_copy.get_text()
-        
-        # Clean up common artifacts
-        lines = code_text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Remove leading/trailing whitespace but preserve indentation structure
-            cleaned_line = line.rstrip()
-            cleaned_lines.append(cleaned_line)
-        
-        return '\n'.join(cleaned_lines)
-    
-    def _already_processed_code_block(self, code_elem: Tag, existing_blocks: List[str]) -> bool:
-        """Check if this code block was already processed."""
-        code_content = self._extract_clean_code_content(code_elem)
-        code_snippet = code_content[:100]  # First 100 chars for comparison
-        
-        for block in existing_blocks:
-            if code_snippet in block:
-                return True
-        return False
-    
-    def _apply_pygments_highlighting(self, code_content: str, language: str) -> str:
-        """Apply Pygments syntax highlighting to code content."""
-        try:
-            from pygments import highlight
-            from pygments.lexers import get_lexer_by_name, guess_lexer
-            from pygments.formatters import get_formatter_by_name
-            from pygments.util import ClassNotFound
-            
-            # Try to get lexer for the specified language
-            lexer = None
-            if language:
-                try:
-                    lexer = get_lexer_by_name(language, stripall=True)
-                except ClassNotFound:
-                    # Try common language mappings
-                    language_mappings = {
-                        'javascript': 'js',
-                        'typescript': 'ts', 
-                        'shell': 'bash',
-                        'yaml': 'yml'
-                    }
-                    mapped_lang = language_mappings.get(language.lower(), language)
-                    try:
-                        lexer = get_lexer_by_name(mapped_lang, stripall=True)
-                    except ClassNotFound:
-                        pass
-            
-            # If no lexer found, try to guess from content
-            if not lexer:
-                try:
-                    lexer = guess_lexer(code_content)
-                    language = lexer.aliases[0] if lexer.aliases else 'text'
-                except ClassNotFound:
-                    language = 'text'
-            
-            # Format as markdown code block with language
-            return f"```{language}\n{code_content}\n```"
-            
-        except ImportError:
-            # Pygments not available, fall back to basic formatting
-            language = language or ''
-            return f"```{language}\n{code_content}\n```"
+        return _has_all(element, 'text-text-500', 'font-small', 'p-3.5')
+    
+    def _fence_code_block(self, code_content: str, language: str) -> str:
+        """Format code content as a fenced markdown code block labelled with its language."""
+        # The language comes from the element's classes or the content
+        # sniffing in _detect_code_language; unlabelled blocks are plain text
+        return f"```{language or 'text'}\n{code_content}\n```"
     
-    def _detect_code_language(self, code_element: Tag) -> str:
-        """Detect programming language from code element."""
+    def _detect_code_language(self, code_element: Tag, content: Optional[str] = None) -> str:
+        """
+        Detect programming language from code element.
+        
+        Args:
+            code_element: The code element
+            content: The element's text, if the caller already extracted it
+            
+        Returns:
+            Language name, or an empty string if none was detected
+        """
         # Check element classes for language hints
         classes = code_element.get('class', [])
         for cls in classes:
@@ -679,7 +625,7 @@ class ConversationParser:
                     return cls.replace('language-', '')
                 elif cls.startswith('lang-'):
                     return cls.replace('lang-', '')
-                elif cls in ['python', 'javascript', 'java', 'cpp', 'csharp', 'go', 'rust', 'typescript']:
+                elif cls in _LANGUAGE_CLASSES:
                     return cls
         
         # Check parent element classes
@@ -691,17 +637,12 @@ class ConversationParser:
                     return cls.replace('language-', '')
         
         # Try to detect from content patterns
-        content = code_element.get_text()
+        if content is None:
+            content = code_element.get_text()
         if content:
-            content_lower = content.lower()
-            if any(pattern in content_lower for pattern in ['def ', 'import ', 'python']):
-                return 'python'
-            elif any(pattern in content_lower for pattern in ['function', 'const ', 'let ', '=>']):
-                return 'javascript'
-            elif 'SELECT' in content.upper() and 'FROM' in content.upper():
-                return 'sql'
-            elif any(pattern in content for pattern in ['#include', 'std::', 'int main']):
-                return 'cpp'
+            for language, pattern in _LANG_SNIFF:
+                if pattern.search(content):
+                    return language
         
         return ''
     
@@ -709,24 +650,20 @@ class ConversationParser:
         """Extract tool usage, web searches, and other special content."""
         tool_content = []
         
+        # Walk the subtree for its text once and share it between both checks
+        text = element.get_text()
+        
         # Look for web search results
-        search_indicators = element.find_all(string=re.compile(r'web search|search results|fetched|favicon', re.I))
+        search_indicators = element.find_all(string=_SEARCH_RE)
         if search_indicators:
             # This might contain web search results
-            search_text = element.get_text()
-            if any(indicator in search_text.lower() for indicator in ['web search', 'fetched', 'search results']):
-                tool_content.append("**Web Search Results:**\n\n" + self._clean_search_results(search_text))
+            text_lower = text.lower()
+            if any(indicator in text_lower for indicator in ['web search', 'fetched', 'search results']):
+                tool_content.append("**Web Search Results:**\n\n" + self._clean_search_results(text))
         
         # Look for other tool usage patterns
-        tool_patterns = [
-            (r'Failed to fetch', 'Network Request'),
-            (r'Analyzing|Examined|Investigating', 'Analysis'),
-            (r'Probed|Pondered', 'Thinking Process')
-        ]
-        
-        text = element.get_text()
-        for pattern, tool_type in tool_patterns:
-            if re.search(pattern, text, re.I):
+        for pattern, tool_type in _TOOL_PATTERNS:
+            if pattern.search(text):
                 relevant_text = self._extract_relevant_context(text, pattern)
                 if relevant_text:
                     tool_content.append(f"**{tool_type}:**\n\n{relevant_text}")
@@ -735,47 +672,55 @@ class ConversationParser:
     
     def _clean_search_results(self, text: str) -> str:
         """Clean and format web search results."""
-        # Remove excessive whitespace and format nicely
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        return '\n'.join(lines)
+        # Strip every line and drop blank ones: any whitespace run that spans a
+        # newline collapses to that single newline
+        return _LINE_BREAK_WS_RE.sub('\n', text).strip()
     
-    def _extract_relevant_context(self, text: str, pattern: str) -> str:
+    def _extract_relevant_context(self, text: str, pattern: re.Pattern) -> str:
         """Extract relevant context around a pattern match."""
-        # Find the line containing the pattern and surrounding context
-        lines = text.split('\n')
-        relevant_lines = []
-        
-        for i, line in enumerate(lines):
-            if re.search(pattern, line, re.I):
-                # Include some context around the match
-                start = max(0, i - 1)
-                end = min(len(lines), i + 3)
-                relevant_lines.extend(lines[start:end])
+        # Tool patterns never span a newline, so one search over the whole
+        # text finds the same first matching line as a per-line scan
+        match = pattern.search(text)
+        if not match:
+            return text[:200]
+        
+        # Include the line before and the two lines after the matching one,
+        # located by newline offsets instead of splitting the whole text
+        start = text.rfind('\n', 0, match.start())
+        if start != -1:
+            start = text.rfind('\n', 0, start)
+        end = text.find('\n', match.end())
+        for _ in range(2):
+            if end == -1:
                 break
-        
-        return '\n'.join(relevant_lines) if relevant_lines else text[:200]
+            end = text.find('\n', end + 1)
+        if end == -1:
+            end = len(text)
+        return text[start + 1:end]
     
     def _extract_text_content(self, element: Tag) -> str:
         """Extract main text content, filtering out code blocks and artifacts already processed."""
-        # Clone the element to avoid modifying the original
-        element_copy = element.__copy__()
-        
-        # Remove code blocks that we've already processed
-        for code_block in element_copy.select('pre, .code-block'):
-            code_block.decompose()
+        from bs4 import NavigableString
         
-        # Remove any artifact containers
-        for artifact in element_copy.select('.artifact, [data-artifact]'):
-            artifact.decompose()
-        
-        # Process remaining child elements
+        # Process child elements, skipping code blocks and artifacts. Strings
+        # have no tag name; the exact class check leaves out comments and
+        # other NavigableString subclasses.
         content = []
-        for child in element_copy.children:
-            if isinstance(child, NavigableString):
-                text = str(child).strip()
-                if text:
-                    content.append(text)
-            elif isinstance(child, Tag):
+        for child in element.children:
+            if child.name is None:
+                if child.__class__ is NavigableString:
+                    text = child.strip()
+                    if text:
+                        content.append(text)
+            else:
+                if _is_processed_block(child):
+                    continue
+                if child.find(_is_processed_block) is not None:
+                    # Only clone the children that need pruning, leaving the
+                    # original tree untouched
+                    child = child.__copy__()
+                    for block in child.find_all(_is_processed_block):
+                        block.decompose()
                 formatted = self._format_html_element(child)
                 if formatted:
                     content.append(formatted)
@@ -786,73 +731,123 @@ class ConversationParser:
         """Format HTML element as markdown."""
         if not element or not element.name:
             return ""
-        tag_name = element.name.lower()
         
-        # Handle different HTML elements
-        if tag_name == 'p':
-            return element.get_text().strip()
+        # Skip empty wrappers and whitespace-only leaves without walking them
+        contents = element.contents
+        if not contents or (len(contents) == 1 and contents[0].name is None and
+                            not contents[0].strip()):
+            return ""
         
-        elif tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            level = int(tag_name[1])
-            return f"{'#' * level} {element.get_text().strip()}"
+        # Unknown elements fall back to their text content
+        formatter = self._formatters.get(element.name.lower(), self._format_text)
+        return formatter(element)
+    
+    def _format_text(self, element: Tag) -> str:
+        """Format an element as its stripped text content."""
+        return element.get_text().strip()
+    
+    def _format_heading(self, element: Tag) -> str:
+        """Format an h1-h6 element as a markdown heading."""
+        level = int(element.name[1])
+        return f"{'#' * level} {element.get_text().strip()}"
+    
+    def _format_bold(self, element: Tag) -> str:
+        """Format a strong/b element as bold text."""
+        return f"**{element.get_text().strip()}**"
+    
+    def _format_italic(self, element: Tag) -> str:
+        """Format an em/i element as italic text."""
+        return f"*{element.get_text().strip()}*"
+    
+    def _format_inline_code(self, element: Tag) -> str:
+        """Format a code element as inline code."""
+        return f"`{element.get_text()}`"
+    
+    def _format_pre(self, element: Tag) -> str:
+        """Format a pre element as a fenced code block."""
+        code_element = _find_child(element, 'code')
+        if code_element:
+            # Use the improved code extraction and language detection
+            # Extract the text once for both the fence body and language sniffing
+            text = code_element.get_text()
+            code_content = _clean_code_text(text)
+            language = self._detect_code_language(code_element, text)
+            return self._fence_code_block(code_content, language)
+        else:
+            code_content = element.get_text()
+            return f"```\n{code_content}\n```"
+    
+    def _format_link(self, element: Tag) -> str:
+        """Format an a element as a markdown link."""
+        href = element.get('href', '')
+        text = element.get_text().strip()
+        return f"[{text}]({href})" if href else text
+    
+    def _format_unordered_list(self, element: Tag) -> str:
+        """Format a ul element as a bulleted list."""
+        return '\n'.join(self._format_list_item(li, "- ")
+                         for li in element.find_all('li', recursive=False))
+    
+    def _format_ordered_list(self, element: Tag) -> str:
+        """Format an ol element as a numbered list."""
+        return '\n'.join(self._format_list_item(li, f"{i}. ")
+                         for i, li in enumerate(element.find_all('li', recursive=False), 1))
+    
+    def _format_list_item(self, li: Tag, marker: str) -> str:
+        """
+        Format one list item, rendering nested lists as indented sub-lists.
         
-        elif tag_name == 'strong' or tag_name == 'b':
-            return f"**{element.get_text().strip()}**"
+        Each list only looks at its own items, so nested items are visited
+        once rather than once per enclosing list.
         
-        elif tag_name == 'em' or tag_name == 'i':
-            return f"*{element.get_text().strip()}*"
+        Args:
+            li: The li element
+            marker: Bullet or number prefix for the item's first line
+            
+        Returns:
+            Markdown for the item and any nested lists
+        """
+        # Same string types get_text() would include for this tag
+        string_types = li.interesting_string_types
+        text_parts = []
+        nested = []
+        for child in li.children:
+            if child.name is None:
+                if type(child) in string_types:
+                    text_parts.append(child)
+            elif child.name in ('ul', 'ol'):
+                nested_list = self._format_html_element(child)
+                if nested_list:
+                    nested.append(_LINE_START_RE.sub('  ', nested_list))
+            else:
+                text_parts.append(child.get_text())
         
-        elif tag_name == 'code':
-            return f"`{element.get_text()}`"
+        return '\n'.join([marker + ''.join(text_parts).strip()] + nested)
+    
+    def _format_blockquote(self, element: Tag) -> str:
+        """Format a blockquote element with quoted lines."""
+        return _LINE_START_RE.sub('> ', element.get_text().strip())
+    
+    def _format_div(self, element: Tag) -> str:
+        """
+        Format a div as its code block if it wraps one, otherwise as its text.
         
-        elif tag_name == 'pre':
-            code_element = element.find('code')
-            if code_element:
-                # Use the improved code extraction with Pygments
-                code_content = self._extract_clean_code_content(code_element)
-                language = self._detect_code_language(code_element)
-                return self._apply_pygments_highlighting(code_content, language)
-            else:
-                code_content = element.get_text()
-                return f"```\n{code_content}\n```"
-        
-        elif tag_name == 'a':
-            href = element.get('href', '')
-            text = element.get_text().strip()
-            return f"[{text}]({href})" if href else text
-        
-        elif tag_name == 'ul':
-            items = []
-            for li in element.find_all('li'):
-                items.append(f"- {li.get_text().strip()}")
-            return '\n'.join(items)
-        
-        elif tag_name == 'ol':
-            items = []
-            for i, li in enumerate(element.find_all('li')):
-                items.append(f"{i+1}. {li.get_text().strip()}")
-            return '\n'.join(items)
-        
-        elif tag_name == 'blockquote':
-            lines = element.get_text().strip().split('\n')
-            return '\n'.join(f"> {line}" for line in lines)
-        
-        elif tag_name == 'table':
-            return self._format_table(element)
-        
-        elif tag_name == 'div':
-            # Check if div contains a code block
-            code_pre = element.find('pre', class_='code-block__code')
-            if code_pre:
+        Looks for the code block and gathers the text in the same walk over
+        the subtree, rather than a find() followed by get_text().
+        """
+        # Same string types get_text() would include for this tag
+        string_types = element.interesting_string_types
+        parts = []
+        for node in element.descendants:
+            if node.name is None:
+                if type(node) in string_types:
+                    parts.append(node)
+            elif node.name == 'pre' and _has_all(node, 'code-block__code'):
                 # This div contains a code block, format it properly
-                return self._format_html_element(code_pre)
-            else:
-                # For regular div elements, just return the text content
-                return element.get_text().strip()
+                return self._format_html_element(node)
         
-        else:
-            # For unknown elements, return text content
-            return element.get_text().strip()
+        # For regular div elements, just return the text content
+        return ''.join(parts).strip()
     
     def _format_table(self, table: Tag) -> str:
         """Format HTML table as markdown table."""
@@ -860,15 +855,20 @@ class ConversationParser:
         
         # Get all rows
         for row in table.find_all('tr'):
+            # Cells are direct children of the row, so one pass over them
+            # collects the text and notices header cells
             cells = []
-            for cell in row.find_all(['td', 'th']):
-                cells.append(cell.get_text().strip())
+            has_th = False
+            for cell in row.children:
+                if cell.name in ('td', 'th'):
+                    cells.append(cell.get_text().strip())
+                    has_th = has_th or cell.name == 'th'
             
             if cells:
                 rows.append('| ' + ' | '.join(cells) + ' |')
                 
                 # Add header separator after first row if it contains th elements
-                if row.find('th') and len(rows) == 1:
+                if has_th and len(rows) == 1:
                     separator = '| ' + ' | '.join(['---'] * len(cells)) + ' |'
                     rows.append(separator)
         
@@ -890,48 +890,27 @@ class ConversationParser:
         metadata = parsed_data['metadata']
         messages = parsed_data['messages']
         
-        # Build markdown content
-        markdown_parts = []
-        
-        # Title and metadata
-        title = metadata.get('title', 'Untitled Conversation')
-        markdown_parts.append(f"# {title}")
-        markdown_parts.append("")
-        
-        # Metadata section
-        markdown_parts.append("## Conversation Details")
-        markdown_parts.append("")
-        markdown_parts.append(f"- **URL**: {metadata.get('url', 'Unknown')}")
-        markdown_parts.append(f"- **Share ID**: {metadata.get('share_id', 'Unknown')}")
-        
+        # Title, metadata section and conversation heading in one format call
         if metadata.get('date'):
-            date_str = metadata['date']
-            try:
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                formatted_date = date_obj.strftime('%Y-%m-%d %H:%M:%S UTC')
-                markdown_parts.append(f"- **Date**: {formatted_date}")
-            except:
-                markdown_parts.append(f"- **Date**: {date_str}")
-        
-        markdown_parts.append(f"- **Messages**: {len(messages)}")
-        markdown_parts.append(f"- **Parsed**: {metadata.get('parsed_at', 'Unknown')}")
-        markdown_parts.append("")
-        
-        # Conversation content
-        markdown_parts.append("## Conversation")
-        markdown_parts.append("")
-        
-        for i, message in enumerate(messages):
-            role = message['role']
-            content = message['content']
-            
-            # Add role header
-            role_display = "Human" if role == 'human' else "Claude"
-            markdown_parts.append(f"# {role_display}")
-            markdown_parts.append("")
-            
-            # Add content
-            markdown_parts.append(content)
-            markdown_parts.append("")
+            date_line = f"- **Date**: {_format_date(metadata['date'])}\n"
+        else:
+            date_line = ""
+        header = _MARKDOWN_HEADER.format(
+            title=metadata.get('title', 'Untitled Conversation'),
+            url=metadata.get('url', 'Unknown'),
+            share_id=metadata.get('share_id', 'Unknown'),
+            date_line=date_line,
+            count=len(messages),
+            parsed_at=metadata.get('parsed_at', 'Unknown')
+        )
+        # Each message takes four slots - role heading, blank line, content,
+        # blank line - so the list is sized once and the headings and bodies
+        # are filled in by slice. Bodies go in by reference, so the final
+        # join is the only place each one is copied.
+        markdown_parts = [""] * (1 + 4 * len(messages))
+        markdown_parts[0] = header
+        markdown_parts[1::4] = ["# Human" if message['role'] == 'human' else "# Claude"
+                                for message in messages]
+        markdown_parts[3::4] = [message['content'] for message in messages]
         
         return '\n'.join(markdown_parts)
\ No newline at end of file
@@ -2,12 +2,29 @@
 Web scraper for Claude.ai share URLs.
 """
 
+import json
+import logging
+import os
+import re
 import time
 import random
-from typing import Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Mapping, NamedTuple, Optional, Union, Dict, Any
 import cloudscraper
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import requests
+from requests.cookies import create_cookie
+
+# Incremental C HTML parser for fetch_conversation(parse=True) (optional)
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 # Advanced browser automation imports
 try:
@@ -16,7 +33,7 @@ try:
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -35,41 +52,201 @@ try:
 except ImportError:
     UNDETECTED_CHROME_AVAILABLE = False
 
-from .utils import get_user_agent, is_valid_claude_share_url
+from .utils import USER_AGENT, is_valid_claude_share_url, truncate_text
+
+logger = logging.getLogger(__name__)
+
+# Text that only shows up on Cloudflare's challenge interstitial
+_CLOUDFLARE_INDICATORS = (
+    'Just a moment...',
+    'Checking if the site connection is secure',
+    'needs to review the security of your connection',
+    'Enable JavaScript and cookies to continue',
+    'cf-browser-verification'
+)
+
+# Command-line switches for the Selenium Chrome launch, built once at import
+_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    
+    # More realistic browser profile
+    '--disable-extensions',
+    '--disable-plugins-discovery',
+    '--start-maximized',
+    '--window-size=1920,1080',
+    
+    # Use a more realistic user agent
+    f'--user-agent={USER_AGENT}',
+    
+    # Disable various automation indicators
+    '--disable-automation',
+    '--disable-infobars',
+    '--disable-browser-side-navigation',
+    '--disable-gpu',
+    '--no-first-run',
+    '--disable-default-apps'
+)
+
+# Switches for undetected-chromedriver, which patches the rest itself
+_UNDETECTED_CHROME_ARGS = (
+    # Use realistic window size
+    '--window-size=1920,1080',
+    '--start-maximized',
+    
+    # Disable some automation indicators
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions'
+)
+
+# Failures worth retrying - anything else (bad URL, SSL error, too many
+# redirects) would fail the same way again
+_TRANSIENT_ERRORS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    cloudscraper.exceptions.CloudflareChallengeError
+)
+
+# Responses worth retrying - the server is overloaded or asking us to slow down
+_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+
+# HEAD statuses that mean the share is gone, so a full fetch would be wasted.
+# A 403 only counts when Cloudflare did not mark it as a challenge.
+_GONE_STATUSES = frozenset((403, 404, 410))
+
+# Browser cloudscraper impersonates - saved cookies are only reused by a
+# session with the same profile
+_BROWSER_PROFILE = {
+    'browser': 'chrome',
+    'platform': 'darwin',
+    'desktop': True
+}
+
+# Saved cookies older than this are ignored; clearances rarely live longer
+_COOKIE_JAR_MAX_AGE = 2 * 60 * 60
+
+# Browser fallbacks raced against cloudscraper: (display name, method name)
+_BROWSER_BYPASS_METHODS = (
+    ('SeleniumBase UC Mode', 'fetch_conversation_with_seleniumbase_uc'),
+    ('Undetected ChromeDriver', 'fetch_conversation_with_undetected_chrome'),
+    ('Enhanced Browser (Selenium)', 'fetch_conversation_with_browser')
+)
+
+# Seconds cloudscraper's request runs alone in fetch_conversation_advanced
+# before the browser methods are started alongside it, counted from when the
+# request is sent rather than while it waits on rate limiting or warm-up
+_BYPASS_HEAD_START = 2.0
+
+# Error text longer than this is cut short in log messages - driver errors
+# can carry whole stack traces
+_LOGGED_ERROR_LENGTH = 200
+
+# Longest wait between attempts; a Retry-After beyond this ends the retries
+_RETRY_DELAY_CAP = 30.0
+
+# Body chunk size fed to the incremental parser
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Chrome's new headless mode (109+) runs the full browser without a window, so
+# unlike the old headless shell it renders and fingerprints like headful Chrome
+_HEADLESS_ARG = '--headless=new'
+
+# Message turns the parser reads - once one is present the conversation has rendered
+_RENDERED_TURN_CSS = '[data-testid="user-message"], [data-is-streaming="false"]'
+
+# All indicators in one case-insensitive pattern, so a page is scanned once
+# without first making a lowercased copy of it
+_CLOUDFLARE_RE = re.compile('|'.join(map(re.escape, _CLOUDFLARE_INDICATORS)), re.I)
+_CLOUDFLARE_BY_LOWER = {indicator.lower(): indicator for indicator in _CLOUDFLARE_INDICATORS}
+
+# Headers of failed results that never got a response - shared and read-only
+_EMPTY_HEADERS = MappingProxyType({})
+
+
+def _find_cloudflare_indicator(text: str) -> Optional[str]:
+    """Return the first Cloudflare challenge indicator found in the text, if any."""
+    match = _CLOUDFLARE_RE.search(text)
+    return _CLOUDFLARE_BY_LOWER[match.group(0).lower()] if match else None
+
+
+class FetchResult(NamedTuple):
+    """Outcome of fetching one share URL."""
+    success: bool
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    html_content: Optional[str] = None
+    headers: Mapping[str, str] = _EMPTY_HEADERS
+    tree: Any = None
+
+
+def _error(message: str, status_code: Optional[int] = None, html_content: Optional[str] = None,
+           headers: Mapping[str, str] = _EMPTY_HEADERS) -> FetchResult:
+    """
+    Build the result the fetch methods return on failure.
+    
+    Args:
+        message: Error description
+        status_code: HTTP status, if a response was received
+        html_content: Page source worth keeping for debugging, if any
+        headers: Response headers, if a response was received
+        
+    Returns:
+        FetchResult with success set to False
+    """
+    return FetchResult(False, message, status_code, html_content, headers)
 
 
 class RateLimiter:
-    """Simple rate limiter to avoid overwhelming servers."""
+    """Thread-safe token-bucket rate limiter to avoid overwhelming servers."""
     
-    def __init__(self, min_delay: float = 1.0, max_delay: float = 3.0):
+    def __init__(self, min_delay: float = 1.0, max_delay: float = 3.0, burst: int = 2):
         """
         Initialize rate limiter.
         
+        Tokens refill continuously at one per average delay, so steady-state
+        requests are spaced by the midpoint of min_delay and max_delay while
+        up to burst requests can go out back to back after an idle spell.
+        
         Args:
             min_delay: Minimum delay between requests in seconds
             max_delay: Maximum delay between requests in seconds
+            burst: Maximum number of requests allowed without waiting
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.last_request = 0.0
+        self.burst = burst
+        average_delay = (min_delay + max_delay) / 2
+        self.rate = 1.0 / average_delay if average_delay > 0 else None
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
     
     def wait(self) -> None:
         """Wait appropriate amount of time before next request."""
-        now = time.time()
-        elapsed = now - self.last_request
-        delay = random.uniform(self.min_delay, self.max_delay)
+        if self.rate is None:
+            return
         
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            # Take a token - a negative balance reserves a slot in the future,
+            # so callers sleep off their own debt without holding the lock
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
         
-        self.last_request = time.time()
+        if delay > 0:
+            time.sleep(delay)
 
 
 class ClaudeShareScraper:
     """Scraper for Claude.ai share URLs with robust error handling and rate limiting."""
     
     def __init__(self, rate_limit_delay: tuple = (1.0, 3.0), timeout: int = 30, 
-                 max_retries: int = 3, backoff_factor: float = 0.3):
+                 max_retries: int = 3, backoff_factor: float = 0.3, max_concurrency: int = 8,
+                 cookie_jar_path: Optional[Union[str, Path]] = None, headless: bool = True):
         """
         Initialize scraper.
         
@@ -78,23 +255,141 @@ class ClaudeShareScraper:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             backoff_factor: Backoff factor for retries
+            max_concurrency: Maximum number of requests in flight to claude.ai at once
+            cookie_jar_path: JSON file the session cookies are loaded from and
+                saved back to, so a Cloudflare clearance outlives the process
+            headless: Run the browser fallbacks without a visible window
         """
         self.rate_limiter = RateLimiter(*rate_limit_delay)
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.max_concurrency = max_concurrency
+        self.headless = headless
+        
+        # Caps in-flight requests across every thread sharing this scraper, so
+        # a large pool cannot open enough sockets to trip Cloudflare's limits
+        self._request_slots = threading.BoundedSemaphore(max_concurrency)
         
         # Configure cloudscraper session - no additional adapters needed
-        self.session = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'darwin', 
-                'desktop': True
-            }
-        )
+        self.session = cloudscraper.create_scraper(browser=dict(_BROWSER_PROFILE))
         
         # Cloudscraper handles anti-bot measures internally
-        # Do not add custom adapters or headers as they can interfere
+        # Do not add custom adapters or headers as they can interfere - but
+        # resize the pool of its own HTTPS adapter so every request slot can
+        # keep a live connection to claude.ai instead of redoing TLS
+        self.session.get_adapter('https://').init_poolmanager(
+            2, max_concurrency, block=True
+        )
+        
+        # The claude.ai main page visit that collects Cloudflare cookies is
+        # only needed once per session, not once per URL
+        self._session_warm = False
+        self._warm_lock = threading.Lock()
+        
+        # A clearance cookie saved by an earlier run makes the visit unnecessary
+        self.cookie_jar_path = Path(cookie_jar_path) if cookie_jar_path else None
+        self._saved_cookies = None
+        self._cookie_lock = threading.Lock()
+        if self.cookie_jar_path:
+            self._session_warm = self._load_cookies()
+        
+        # Browsers launched by the fetch_conversation_with_* methods, kept
+        # open across URLs and keyed by kind: (handle, close function). Each
+        # kind has its own lock so different browsers can work at once.
+        self._drivers = {}
+        self._driver_locks = {kind: threading.Lock() for kind in ('seleniumbase', 'undetected', 'selenium')}
+        
+        # Set by close() so a browser fetch still queued on a driver lock
+        # does not launch a browser nothing would ever quit
+        self._closed = False
+    
+    def _warm_session(self) -> None:
+        """Visit the claude.ai main page once so later requests reuse its cookies."""
+        with self._warm_lock:
+            if self._session_warm:
+                return
+            
+            # First visit to any Cloudflare site may take ~5 seconds
+            self.session.get('https://claude.ai/', timeout=30)  # Longer timeout for first visit
+            time.sleep(random.uniform(2, 4))  # Allow Cloudflare processing
+            self._session_warm = True
+            self._save_cookies()
+    
+    def _load_cookies(self) -> bool:
+        """
+        Load unexpired cookies saved by an earlier run into the session.
+        
+        Cloudflare ties its clearance to the user agent that solved the
+        challenge, so the saved one replaces the randomly picked default.
+        Files older than _COOKIE_JAR_MAX_AGE or saved under a different
+        browser profile are ignored.
+        
+        Returns:
+            True if a live Cloudflare clearance cookie was loaded
+        """
+        try:
+            if time.time() - self.cookie_jar_path.stat().st_mtime > _COOKIE_JAR_MAX_AGE:
+                return False
+            saved = json.loads(self.cookie_jar_path.read_text(encoding='utf-8'))
+            if saved['browser'] != _BROWSER_PROFILE:
+                return False
+            user_agent = saved['user_agent']
+            records = saved['cookies']
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        
+        self.session.headers['User-Agent'] = user_agent
+        now = time.time()
+        has_clearance = False
+        for record in records:
+            try:
+                cookie = create_cookie(**record)
+            except TypeError:
+                continue  # Written by an incompatible version
+            if cookie.is_expired(now):
+                continue
+            self.session.cookies.set_cookie(cookie)
+            has_clearance = has_clearance or cookie.name == 'cf_clearance'
+        return has_clearance
+    
+    def _save_cookies(self) -> None:
+        """Write the session's unexpired cookies to cookie_jar_path if set and changed."""
+        if not self.cookie_jar_path:
+            return
+        
+        now = time.time()
+        records = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'expires': cookie.expires,
+                'secure': cookie.secure
+            }
+            for cookie in self.session.cookies
+            if not cookie.is_expired(now)
+        ]
+        saved = {
+            'browser': _BROWSER_PROFILE,
+            'user_agent': self.session.headers.get('User-Agent'),
+            'cookies': records
+        }
+        with self._cookie_lock:
+            # Successful fetches call this every time, but cookies rarely change
+            if records == self._saved_cookies:
+                return
+            tmp_file = f"{self.cookie_jar_path}.tmp"
+            try:
+                # The jar holds a live Cloudflare clearance - owner-only access
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with open(fd, 'w', encoding='utf-8') as f:
+                    json.dump(saved, f, indent=2)
+                os.replace(tmp_file, self.cookie_jar_path)
+                self._saved_cookies = records
+            except OSError as e:
+                logger.warning("Could not save cookies to %s: %s", self.cookie_jar_path, e)
     
     def _establish_session(self) -> tuple[bool, str]:
         """
@@ -121,132 +416,232 @@ class ClaudeShareScraper:
         except Exception as e:
             return False, f"Exception: {str(e)}"
 
-    def fetch_conversation(self, url: str) -> Dict[str, Any]:
+    def fetch_conversation(self, url: str, parse: bool = False) -> FetchResult:
         """
         Fetch conversation from Claude share URL.
         
+        With parse=True the body is streamed straight into lxml's incremental
+        parser instead of being decoded to one large string first, and the
+        parsed document is returned as tree in place of html_content.
+        
         Args:
             url: Claude.ai share URL
+            parse: Return an lxml element tree instead of the HTML text
             
         Returns:
-            Dictionary containing:
+            FetchResult with:
                 - success: bool
-                - html_content: str (if successful)
+                - html_content: str (if successful and not parse)
+                - tree: lxml.html.HtmlElement (if successful and parse)
                 - error: str (if failed)
                 - status_code: int
-                - headers: dict
+                - headers: case-insensitive mapping of response headers
         """
         # Validate URL
         if not is_valid_claude_share_url(url):
-            return {
-                'success': False,
-                'error': 'Invalid Claude.ai share URL',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Invalid Claude.ai share URL')
+        
+        if parse and not LXML_AVAILABLE:
+            return _error('lxml not available. Install with: uv add lxml')
+        
+        return self._fetch_share(url, parse)
+    
+    def _fetch_share(self, url: str, parse: bool = False,
+                     request_sent: Optional[threading.Event] = None) -> FetchResult:
+        """
+        Fetch a validated share URL with rate limiting and retries.
         
+        Args:
+            url: Claude.ai share URL
+            parse: Return an lxml element tree instead of the HTML text
+            request_sent: Set once rate limiting and session warm-up are
+                over and the request for the page is about to go out
+            
+        Returns:
+            FetchResult as described in fetch_conversation
+        """
         # Apply rate limiting
         self.rate_limiter.wait()
         
         try:
-            # Implement custom retry logic for cloudscraper
-            for attempt in range(self.max_retries + 1):
-                try:
-                    # First visit to any Cloudflare site may take ~5 seconds
-                    if attempt == 0:
+            # Implement custom retry logic for cloudscraper, holding one of
+            # the request slots for the whole exchange
+            with self._request_slots:
+                for attempt in range(self.max_retries + 1):
+                    try:
                         # Visit main page first for session establishment
-                        self.session.get('https://claude.ai/', timeout=30)  # Longer timeout for first visit
-                        time.sleep(random.uniform(2, 4))  # Allow Cloudflare processing
-                    
-                    # Get the share URL
-                    response = self.session.get(url, timeout=self.timeout)
-                    break  # Success, exit retry loop
+                        self._warm_session()
+                        if request_sent is not None:
+                            request_sent.set()
+                        
+                        # Get the share URL
+                        response = self.session.get(url, timeout=self.timeout, stream=parse)
+                        
+                    except _TRANSIENT_ERRORS as e:
+                        if attempt == self.max_retries:
+                            raise e  # Final attempt failed
+                        # Wait before retry
+                        time.sleep(self._retry_delay(attempt))
+                        continue
                     
-                except Exception as e:
-                    if attempt == self.max_retries:
-                        raise e  # Final attempt failed
-                    # Wait before retry
-                    time.sleep(self.backoff_factor * (2 ** attempt))
-            
-            result = {
-                'success': response.status_code == 200,
-                'status_code': response.status_code,
-                'headers': dict(response.headers),
-                'html_content': response.text if response.status_code == 200 else None,
-                'error': None
-            }
+                    if response.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
+                        break  # Final answer, exit retry loop
+                    delay = self._retry_delay(attempt, response)
+                    if delay is None:
+                        break  # Server wants us gone longer than we wait
+                    response.close()
+                    time.sleep(delay)
             
             if response.status_code != 200:
-                result['error'] = f"HTTP {response.status_code}: {response.reason}"
+                response.close()
+                return _error(f"HTTP {response.status_code}: {response.reason}",
+                              status_code=response.status_code, headers=response.headers)
             
+            if parse:
+                with response:
+                    tree = self._parse_streamed(response)
+                result = FetchResult(True, status_code=200, headers=response.headers, tree=tree)
+            else:
+                result = FetchResult(True, status_code=200, headers=response.headers,
+                                     html_content=response.text)
+            
+            # Keep the cookies that just worked for the next run
+            self._save_cookies()
             return result
             
         except requests.exceptions.Timeout:
-            return {
-                'success': False,
-                'error': f'Request timeout after {self.timeout} seconds',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error(f'Request timeout after {self.timeout} seconds')
         except requests.exceptions.ConnectionError:
-            return {
-                'success': False,
-                'error': 'Connection error - check internet connection',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Connection error - check internet connection')
         except requests.exceptions.TooManyRedirects:
-            return {
-                'success': False,
-                'error': 'Too many redirects',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Too many redirects')
         except requests.exceptions.RequestException as e:
-            return {
-                'success': False,
-                'error': f'Request error: {str(e)}',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error(f'Request error: {str(e)}')
+        except cloudscraper.exceptions.CloudflareException as e:
+            return _error(f'Cloudflare challenge not solved: {str(e)}')
         except Exception as e:
-            return {
-                'success': False,
-                'error': f'Unexpected error: {str(e)}',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error(f'Unexpected error: {str(e)}')
     
-    def fetch_multiple_conversations(self, urls: list) -> Dict[str, Dict[str, Any]]:
+    def _retry_delay(self, attempt: int, response=None) -> Optional[float]:
+        """
+        Work out how long to wait before the next attempt.
+        
+        A Retry-After header in seconds is honoured as given. Otherwise the
+        delay is drawn at random between backoff_factor and an exponentially
+        growing ceiling, so concurrent workers that failed together do not
+        all retry together.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            response: Response that asked for a retry, if there was one
+            
+        Returns:
+            Delay in seconds, or None if Retry-After exceeds _RETRY_DELAY_CAP
+        """
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('Retry-After', ''))
+            except ValueError:
+                pass  # Absent, or an HTTP date - fall back to jitter
+            else:
+                return max(0.0, retry_after) if retry_after <= _RETRY_DELAY_CAP else None
+        
+        ceiling = min(_RETRY_DELAY_CAP, self.backoff_factor * 3 ** attempt)
+        return random.uniform(self.backoff_factor, max(self.backoff_factor, ceiling))
+    
+    @staticmethod
+    def _parse_streamed(response):
+        """
+        Feed a streamed response body to lxml chunk by chunk.
+        
+        Args:
+            response: Response opened with stream=True
+            
+        Returns:
+            Root element of the parsed document
+        """
+        # requests reports ISO-8859-1 for any text/html without a charset, but
+        # claude.ai serves UTF-8 - only trust a charset the server declared
+        declared = 'charset' in response.headers.get('Content-Type', '').lower()
+        parser = lxml.html.HTMLParser(encoding=response.encoding if declared else 'utf-8')
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+        return parser.close()
+    
+    def fetch_multiple_conversations(self, urls: list, max_workers: Optional[int] = None,
+                                     precheck: bool = False) -> Dict[str, FetchResult]:
         """
         Fetch multiple conversations from Claude share URLs.
         
+        Fetches are network-bound, so up to max_workers of them run at once on
+        a thread pool sharing this scraper's session. The rate limiter still
+        spaces out when each request starts.
+        
         Args:
             urls: List of Claude.ai share URLs
+            max_workers: Maximum number of URLs to fetch concurrently
+                (defaults to max_concurrency)
+            precheck: Send a HEAD for every URL first and skip the full fetch
+                for shares that are gone (404, 410 or a plain 403)
             
         Returns:
-            Dictionary mapping URL to fetch result
+            Dictionary mapping URL to fetch result, in input order
         """
-        results = {}
+        results = dict.fromkeys(urls)
+        if max_workers is None:
+            max_workers = self.max_concurrency
         
-        for i, url in enumerate(urls):
-            print(f"Fetching {i+1}/{len(urls)}: {url}")
-            result = self.fetch_conversation(url)
-            results[url] = result
-            
-            if result['success']:
-                print(f" Successfully fetched conversation")
+        # Invalid URLs are answered here so they never take a pool thread,
+        # a request slot or a rate limiter token
+        valid = []
+        for url in results:
+            if is_valid_claude_share_url(url):
+                valid.append(url)
             else:
-                print(f" Failed: {result['error']}")
+                results[url] = self.fetch_conversation(url)
+                logger.info("Skipped invalid URL: %s", url)
+        if not valid:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(valid)))) as executor:
+            if precheck:
+                valid = self._drop_gone_urls(executor, valid, results)
+            futures = {executor.submit(self.fetch_conversation, url): url for url in valid}
+            for done, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                result = future.result()
+                results[url] = result
+                
+                if result.success:
+                    logger.info("Fetched %d/%d: %s", done, len(futures), url)
+                else:
+                    logger.info("Failed %d/%d: %s (%s)", done, len(futures), url, result.error)
         
         return results
     
+    def _drop_gone_urls(self, executor: ThreadPoolExecutor, urls: list,
+                        results: Dict[str, FetchResult]) -> list:
+        """
+        HEAD every URL on the batch's pool and filter out shares that are gone.
+        
+        Args:
+            executor: Pool the batch fetches run on
+            urls: Valid Claude.ai share URLs
+            results: Batch results, filled in here for the dropped URLs
+            
+        Returns:
+            URLs still worth a full fetch, in input order
+        """
+        alive = []
+        for url, check in zip(urls, executor.map(self.check_url_accessibility, urls)):
+            status = check['status_code']
+            if status in _GONE_STATUSES and not check['headers'].get('cf-mitigated'):
+                results[url] = _error(f"HTTP {status} on precheck", status_code=status, headers=check['headers'])
+                logger.info("Skipped unavailable URL: %s (%s)", url, results[url].error)
+            else:
+                alive.append(url)
+        return alive
+    
     def check_url_accessibility(self, url: str) -> Dict[str, Any]:
         """
         Check if a Claude share URL is accessible without downloading full content.
@@ -268,16 +663,19 @@ class ClaudeShareScraper:
         
         try:
             # Use HEAD request to check accessibility
-            response = self.session.head(url, timeout=self.timeout)
+            with self._request_slots:
+                response = self.session.head(url, timeout=self.timeout)
             
             return {
                 'accessible': response.status_code == 200,
                 'status_code': response.status_code,
                 'error': None if response.status_code == 200 else f"HTTP {response.status_code}",
-                'headers': dict(response.headers)
+                'headers': response.headers
             }
             
-        except requests.exceptions.RequestException as e:
+        except Exception as e:
+            # Includes cloudscraper's challenge errors, which are not
+            # RequestExceptions - a challenged HEAD says nothing about the share
             return {
                 'accessible': False,
                 'error': str(e),
@@ -285,527 +683,468 @@ class ClaudeShareScraper:
                 'headers': {}
             }
     
-    def fetch_conversation_with_browser(self, url: str) -> Dict[str, Any]:
+    def fetch_conversation_with_browser(self, url: str,
+                                        cancel: Optional[threading.Event] = None) -> FetchResult:
         """
         Fetch conversation using Selenium browser to handle JavaScript rendering.
         
         Args:
             url: Claude.ai share URL
+            cancel: Give up without loading the page if this is set by the
+                time the browser is free
             
         Returns:
-            Dictionary containing response data
+            FetchResult with the page source
         """
         if not SELENIUM_AVAILABLE:
-            return {
-                'success': False,
-                'error': 'Selenium not available. Install with: uv add selenium webdriver-manager',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Selenium not available. Install with: uv add selenium')
         
         if not is_valid_claude_share_url(url):
-            return {
-                'success': False,
-                'error': 'Invalid Claude.ai share URL',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Invalid Claude.ai share URL')
         
-        driver = None
-        try:
-            # Configure Chrome options for better Cloudflare bypass
-            chrome_options = Options()
-            # Don't run headless - some detection systems flag headless browsers
-            # chrome_options.add_argument('--headless')  # Commented out for now
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
+        with self._driver_locks['selenium']:
+            if self._fetch_cancelled(cancel):
+                return _error('Fetch cancelled')
             
-            # More realistic browser profile
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-plugins-discovery')
-            chrome_options.add_argument('--start-maximized')
-            chrome_options.add_argument('--window-size=1920,1080')
-            
-            # Use a more realistic user agent
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36')
-            
-            # Disable various automation indicators
-            chrome_options.add_argument('--disable-automation')
-            chrome_options.add_argument('--disable-infobars')
-            chrome_options.add_argument('--disable-browser-side-navigation')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--no-first-run')
-            chrome_options.add_argument('--disable-default-apps')
-            
-            # Initialize driver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            try:
+                driver = self._ensure_driver('selenium', self._launch_selenium_driver)
+                
+                # Navigate to the share URL
+                logger.debug("Navigating to share URL...")
+                driver.get(url)
+                
+                # Wait for the conversation to render rather than sleeping
+                if not self._wait_for_claude_render(driver, cancel=cancel):
+                    return _error('Fetch cancelled')
+                
+                # Get the fully rendered HTML with error handling
+                try:
+                    html_content = driver.page_source
+                    logger.debug("Successfully retrieved %d characters of HTML", len(html_content))
+                except Exception as e:
+                    return _error(f'Failed to get page source: {str(e)}')
+                
+                # Quick validation - check if we actually have conversation content
+                if 'animate-spin' in html_content and len(html_content) < 50000:
+                    # Likely still showing loading page
+                    return _error('Page still loading - content not fully rendered', html_content=html_content)  # Include it for debugging
+                
+                # Check for Cloudflare challenge page indicators
+                indicator = _find_cloudflare_indicator(html_content)
+                if indicator:
+                    return _error(f'Cloudflare challenge detected: {indicator}', html_content=html_content)
+                
+                return FetchResult(True, status_code=200, html_content=html_content)
+                
+            except Exception as e:
+                # A failed page load can leave the browser unusable - relaunch next time
+                self._discard_driver('selenium')
+                return _error(f'Browser error: {str(e)}')
+    
+    def _wait_for_claude_render(self, driver, timeout: int = 30,
+                                cancel: Optional[threading.Event] = None) -> bool:
+        """
+        Wait until a share page has rendered its conversation.
+        
+        Polls for the page's own completion signals - no loading spinner,
+        document loaded, message turns present - so a fast page is captured
+        as soon as it is ready instead of after a fixed worst-case sleep.
+        Each step gives up quietly at the timeout so a slow page is still
+        captured as it stands. Every poll also checks for cancellation, so a
+        fetch that lost the race or was closed frees its browser at once.
+        
+        Args:
+            driver: Selenium WebDriver showing the share page
+            timeout: Maximum seconds to wait for each signal
+            cancel: Event the caller sets when it no longer wants the page
             
+        Returns:
+            False if the fetch was cancelled while waiting, True otherwise
+        """
+        wait = WebDriverWait(driver, timeout)
+        signals = [
+            lambda d: not d.find_elements(By.CSS_SELECTOR, '.animate-spin'),
+            lambda d: d.execute_script("return document.readyState") == 'complete',
+            lambda d: d.find_elements(By.CSS_SELECTOR, _RENDERED_TURN_CSS)
+        ]
+        for signal in signals:
+            try:
+                wait.until(lambda d, signal=signal: self._fetch_cancelled(cancel) or signal(d))
+            except TimeoutException:
+                logger.warning("Timed out waiting for the page to render, continuing")
+            if self._fetch_cancelled(cancel):
+                return False
+        
+        # Scroll to the bottom and back to trigger any lazy loading, then give
+        # any spinner it started a few seconds to clear
+        try:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            WebDriverWait(driver, 5).until(lambda d: self._fetch_cancelled(cancel) or signals[0](d))
+        except TimeoutException:
+            pass
+        except Exception as e:
+            logger.warning("Scroll error (non-fatal): %s", e)
+        if self._fetch_cancelled(cancel):
+            return False
+        try:
+            driver.execute_script("window.scrollTo(0, 0);")
+        except Exception as e:
+            logger.warning("Scroll error (non-fatal): %s", e)
+        return True
+    
+    def _launch_selenium_driver(self) -> tuple:
+        """
+        Start Chrome under Selenium and visit the claude.ai main page once.
+        
+        Returns:
+            Tuple of (driver, close function)
+        """
+        # Configure Chrome options for better Cloudflare bypass
+        chrome_options = Options()
+        for argument in _CHROME_ARGS:
+            chrome_options.add_argument(argument)
+        if self.headless:
+            chrome_options.add_argument(_HEADLESS_ARG)
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Initialize driver - Selenium Manager finds or downloads chromedriver
+        service = Service()
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        try:
             # Execute script to remove webdriver property and other automation indicators
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
             driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})")
             
             # First visit Claude.ai main page to establish session
-            print("Visiting claude.ai main page...")
+            logger.debug("Visiting claude.ai main page...")
             driver.get('https://claude.ai/')
             time.sleep(random.uniform(3, 6))  # Random wait like a human
-            
-            # Navigate to the share URL
-            print(f"Navigating to share URL...")
-            driver.get(url)
-            
-            # Longer wait for heavy JavaScript apps like Claude.ai
-            wait = WebDriverWait(driver, 60)  # Increased from 30 to 60 seconds
-            
-            # First, wait for the loading spinner to disappear
+        except Exception:
+            self._quit_driver(driver)
+            raise
+        
+        return driver, lambda: self._quit_driver(driver)
+    
+    @staticmethod
+    def _quit_driver(driver) -> None:
+        """Quit a Selenium driver, force-killing it if a normal quit fails."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Error closing browser (non-fatal): %s", e)
+            # Try force kill if normal quit fails
             try:
-                # Wait for loading spinner to be gone
-                wait.until_not(EC.presence_of_element_located((By.CSS_SELECTOR, '.animate-spin')))
-                print("Loading spinner disappeared")
+                driver.service.process.terminate()
             except:
-                # Spinner might not be present or might have different class
                 pass
-            
-            # Look for actual conversation content patterns
-            content_indicators = [
-                # Text patterns that indicate conversation content
-                "//*[contains(text(), 'Human') or contains(text(), 'Claude') or contains(text(), 'Assistant')]",
-                # Common conversation UI patterns
-                "[data-testid*='message']",
-                "[class*='message']",
-                "[class*='conversation']",
-                # Try to find any significant text content (not just loading UI)
-                "//*[string-length(normalize-space(text())) > 50]"
-            ]
-            
-            content_found = False
-            for indicator in content_indicators:
-                try:
-                    if indicator.startswith("//"):
-                        # XPath selector
-                        element = wait.until(EC.presence_of_element_located((By.XPATH, indicator)))
-                    else:
-                        # CSS selector
-                        element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, indicator)))
-                    
-                    # Additional check: make sure we have substantial content
-                    if element and len(element.text.strip()) > 20:
-                        content_found = True
-                        print(f"Found content with: {indicator}")
-                        break
-                except:
-                    continue
-            
-            # Give content time to fully load
-            print("Waiting for content to fully render...")
-            time.sleep(15)  # Give substantial time for JS to execute
-            
-            # Simple scroll to bottom and back to trigger any lazy loading
-            try:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
-                driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(2)
-            except Exception as e:
-                print(f"Scroll error (non-fatal): {e}")
-                # Continue even if scrolling fails
-            
-            # Get the fully rendered HTML with error handling
-            try:
-                html_content = driver.page_source
-                print(f"Successfully retrieved {len(html_content)} characters of HTML")
-            except Exception as e:
-                return {
-                    'success': False,
-                    'error': f'Failed to get page source: {str(e)}',
-                    'status_code': None,
-                    'html_content': None,
-                    'headers': {}
-                }
-            
-            # Quick validation - check if we actually have conversation content
-            if 'animate-spin' in html_content and len(html_content) < 50000:
-                # Likely still showing loading page
-                return {
-                    'success': False,
-                    'error': 'Page still loading - content not fully rendered',
-                    'status_code': None,
-                    'html_content': html_content,  # Include it for debugging
-                    'headers': {}
-                }
-                
-            # Check for Cloudflare challenge page indicators
-            cloudflare_indicators = [
-                'Just a moment...',
-                'checking if the site connection is secure',
-                'needs to review the security of your connection',
-                'Enable JavaScript and cookies to continue',
-                'cf-browser-verification'
-            ]
-            
-            content_lower = html_content.lower()
-            for indicator in cloudflare_indicators:
-                if indicator.lower() in content_lower:
-                    return {
-                        'success': False,
-                        'error': f'Cloudflare challenge detected: {indicator}',
-                        'status_code': None,
-                        'html_content': html_content,
-                        'headers': {}
-                    }
-            
-            return {
-                'success': True,
-                'status_code': 200,
-                'html_content': html_content,
-                'headers': {},
-                'error': None
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Browser error: {str(e)}',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception as e:
-                    print(f"Error closing browser (non-fatal): {e}")
-                    # Try force kill if normal quit fails
-                    try:
-                        driver.service.process.terminate()
-                    except:
-                        pass
     
-    def fetch_conversation_with_seleniumbase_uc(self, url: str) -> Dict[str, Any]:
+    def fetch_conversation_with_seleniumbase_uc(self, url: str,
+                                                cancel: Optional[threading.Event] = None) -> FetchResult:
         """
         Fetch conversation using SeleniumBase UC Mode for advanced Cloudflare bypass.
         
         Args:
             url: Claude.ai share URL
+            cancel: Give up without loading the page if this is set by the
+                time the browser is free
             
         Returns:
-            Dictionary containing response data
+            FetchResult with the page source
         """
         if not SELENIUMBASE_AVAILABLE:
-            return {
-                'success': False,
-                'error': 'SeleniumBase not available. Install with: uv add seleniumbase',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('SeleniumBase not available. Install with: uv add seleniumbase')
         
         if not is_valid_claude_share_url(url):
-            return {
-                'success': False,
-                'error': 'Invalid Claude.ai share URL',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Invalid Claude.ai share URL')
         
-        print("Using SeleniumBase UC Mode for advanced Cloudflare bypass...")
+        logger.info("Using SeleniumBase UC Mode for advanced Cloudflare bypass...")
         
-        try:
-            with SB(uc=True, headless=False, test=True, xvfb=False) as sb:
-                # Visit Claude.ai main page first
-                print("Establishing session with Claude.ai...")
-                sb.uc_open_with_reconnect("https://claude.ai/", 4)
-                sb.sleep(random.uniform(2, 5))
+        with self._driver_locks['seleniumbase']:
+            if self._fetch_cancelled(cancel):
+                return _error('Fetch cancelled')
+            
+            try:
+                sb = self._ensure_driver('seleniumbase', self._launch_seleniumbase)
                 
                 # Navigate to the share URL
-                print("Loading share URL with UC reconnect...")
+                logger.debug("Loading share URL with UC reconnect...")
                 sb.uc_open_with_reconnect(url, 6)  # Wait up to 6 seconds for reconnect
                 
-                # Wait for content to load - try multiple strategies
-                content_loaded = False
-                
-                # Strategy 1: Look for specific conversation elements
-                conversation_selectors = [
-                    '[data-testid*="message"]',
-                    '[class*="message"]',
-                    '[class*="conversation"]',
-                    'main'
-                ]
+                # Wait for the conversation to render rather than sleeping
+                if not self._wait_for_claude_render(sb.driver, cancel=cancel):
+                    return _error('Fetch cancelled')
                 
-                for selector in conversation_selectors:
+                # Check for Cloudflare challenges and handle them
+                indicator = _find_cloudflare_indicator(sb.get_text('body'))
+                if indicator:
+                    logger.info("Detected Cloudflare challenge: %s", indicator)
+                    # Try the GUI click captcha method
                     try:
-                        if sb.is_element_present(selector, timeout=10):
-                            content_loaded = True
-                            print(f"Content detected with selector: {selector}")
-                            break
+                        sb.uc_gui_click_captcha()
+                        self._wait_for_claude_render(sb.driver, cancel=cancel)  # Wait after solving
+                        logger.info("Attempted to solve Cloudflare challenge")
                     except:
-                        continue
-                
-                # Strategy 2: Wait for page stability (no loading spinners)
-                try:
-                    # Wait for loading spinners to disappear
-                    if sb.is_element_present('.animate-spin', timeout=2):
-                        print("Waiting for loading spinner to disappear...")
-                        sb.wait_for_element_not_visible('.animate-spin', timeout=30)
-                except:
-                    pass  # Spinner might not be present
-                
-                # Strategy 3: Wait for substantial page content
-                sb.sleep(10)  # Give time for JavaScript to fully execute
-                
-                # Check for Cloudflare challenges and handle them
-                cloudflare_indicators = [
-                    'Just a moment...',
-                    'Checking if the site connection is secure',
-                    'Enable JavaScript and cookies to continue'
-                ]
-                
-                page_text = sb.get_text('body').lower()
-                for indicator in cloudflare_indicators:
-                    if indicator.lower() in page_text:
-                        print(f"Detected Cloudflare challenge: {indicator}")
-                        # Try the GUI click captcha method
-                        try:
-                            sb.uc_gui_click_captcha()
-                            sb.sleep(5)  # Wait after solving
-                            print("Attempted to solve Cloudflare challenge")
-                        except:
-                            print("Could not solve Cloudflare challenge automatically")
-                
-                # Scroll to trigger any lazy loading
-                try:
-                    sb.scroll_to_bottom()
-                    sb.sleep(2)
-                    sb.scroll_to_top()
-                    sb.sleep(1)
-                except:
-                    pass  # Continue if scrolling fails
+                        logger.warning("Could not solve Cloudflare challenge automatically")
+                    if self._fetch_cancelled(cancel):
+                        return _error('Fetch cancelled')
                 
                 # Get the fully rendered HTML
                 html_content = sb.get_page_source()
-                print(f"Successfully retrieved {len(html_content)} characters with SeleniumBase UC Mode")
+                logger.debug("Successfully retrieved %d characters with SeleniumBase UC Mode", len(html_content))
                 
                 # Final validation
-                if any(indicator.lower() in html_content.lower() for indicator in cloudflare_indicators):
-                    return {
-                        'success': False,
-                        'error': 'Cloudflare challenge not bypassed with UC Mode',
-                        'status_code': None,
-                        'html_content': html_content,
-                        'headers': {}
-                    }
+                if _find_cloudflare_indicator(html_content):
+                    return _error('Cloudflare challenge not bypassed with UC Mode', html_content=html_content)
                 
-                return {
-                    'success': True,
-                    'status_code': 200,
-                    'html_content': html_content,
-                    'headers': {},
-                    'error': None
-                }
+                return FetchResult(True, status_code=200, html_content=html_content)
                 
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'SeleniumBase UC Mode error: {str(e)}',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            except Exception as e:
+                # A failed page load can leave the browser unusable - relaunch next time
+                self._discard_driver('seleniumbase')
+                return _error(f'SeleniumBase UC Mode error: {str(e)}')
+    
+    def _launch_seleniumbase(self) -> tuple:
+        """
+        Open a SeleniumBase UC Mode browser and visit the claude.ai main page once.
+        
+        The SB context manager owns the browser, so it is entered here and
+        kept open on an ExitStack until the browser is discarded.
+        
+        Returns:
+            Tuple of (sb, close function)
+        """
+        stack = ExitStack()
+        sb = stack.enter_context(SB(uc=True, headless2=self.headless, test=True, xvfb=False))
+        
+        try:
+            # Visit Claude.ai main page first
+            logger.debug("Establishing session with Claude.ai...")
+            sb.uc_open_with_reconnect("https://claude.ai/", 4)
+            sb.sleep(random.uniform(2, 5))
+        except Exception:
+            stack.close()
+            raise
+        
+        return sb, stack.close
     
-    def fetch_conversation_with_undetected_chrome(self, url: str) -> Dict[str, Any]:
+    def fetch_conversation_with_undetected_chrome(self, url: str,
+                                                  cancel: Optional[threading.Event] = None) -> FetchResult:
         """
         Fetch conversation using undetected-chromedriver for stealth browsing.
         
         Args:
             url: Claude.ai share URL
+            cancel: Give up without loading the page if this is set by the
+                time the browser is free
             
         Returns:
-            Dictionary containing response data
+            FetchResult with the page source
         """
         if not UNDETECTED_CHROME_AVAILABLE:
-            return {
-                'success': False,
-                'error': 'Undetected ChromeDriver not available. Install with: uv add undetected-chromedriver',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Undetected ChromeDriver not available. Install with: uv add undetected-chromedriver')
         
         if not is_valid_claude_share_url(url):
-            return {
-                'success': False,
-                'error': 'Invalid Claude.ai share URL',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
+            return _error('Invalid Claude.ai share URL')
         
-        print("Using undetected-chromedriver for stealth browsing...")
+        logger.info("Using undetected-chromedriver for stealth browsing...")
         
-        driver = None
-        try:
-            # Configure undetected ChromeDriver options
-            options = uc.ChromeOptions()
-            
-            # Use realistic window size
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('--start-maximized')
-            
-            # Disable some automation indicators
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-extensions')
-            
-            # Don't use headless mode - it's more detectable
-            # options.add_argument('--headless')  # Keep commented
-            
-            # Initialize undetected ChromeDriver
-            driver = uc.Chrome(options=options, version_main=None)  # Auto-detect Chrome version
+        with self._driver_locks['undetected']:
+            if self._fetch_cancelled(cancel):
+                return _error('Fetch cancelled')
             
+            try:
+                driver = self._ensure_driver('undetected', self._launch_undetected_driver)
+                
+                # Navigate to share URL
+                logger.debug("Loading share URL...")
+                driver.get(url)
+                
+                # Wait for the conversation to render rather than sleeping
+                if not self._wait_for_claude_render(driver, cancel=cancel):
+                    return _error('Fetch cancelled')
+                
+                # Get HTML content
+                html_content = driver.page_source
+                logger.debug("Retrieved %d characters with undetected-chromedriver", len(html_content))
+                
+                # Check for Cloudflare challenges
+                indicator = _find_cloudflare_indicator(html_content)
+                if indicator:
+                    return _error(f'Cloudflare challenge detected with undetected-chrome: {indicator}', html_content=html_content)
+                
+                return FetchResult(True, status_code=200, html_content=html_content)
+                
+            except Exception as e:
+                # A failed page load can leave the browser unusable - relaunch next time
+                self._discard_driver('undetected')
+                return _error(f'Undetected ChromeDriver error: {str(e)}')
+    
+    def _launch_undetected_driver(self) -> tuple:
+        """
+        Start undetected-chromedriver and visit the claude.ai main page once.
+        
+        Returns:
+            Tuple of (driver, close function)
+        """
+        # Configure undetected ChromeDriver options
+        options = uc.ChromeOptions()
+        for argument in _UNDETECTED_CHROME_ARGS:
+            options.add_argument(argument)
+        if self.headless:
+            options.add_argument(_HEADLESS_ARG)
+        
+        # Initialize undetected ChromeDriver
+        driver = uc.Chrome(options=options, version_main=None)  # Auto-detect Chrome version
+        
+        try:
             # Set realistic viewport
             driver.set_window_size(1920, 1080)
             
             # Visit Claude.ai main page first to establish session
-            print("Establishing session with Claude.ai...")
+            logger.debug("Establishing session with Claude.ai...")
             driver.get("https://claude.ai/")
             time.sleep(random.uniform(3, 6))
+        except Exception:
+            self._quit_driver(driver)
+            raise
+        
+        return driver, lambda: self._quit_driver(driver)
+    
+    def _ensure_driver(self, kind: str, launch: Callable[[], tuple]):
+        """
+        Return the running browser of the given kind, launching it on first use.
+        
+        Browsers take seconds to start and to clear Cloudflare, so each kind is
+        started once and reused for every URL until close(). Callers hold the
+        kind's lock in _driver_locks, since a browser can only load one page
+        at a time.
+        
+        Args:
+            kind: Key identifying the browser flavour
+            launch: Starts the browser and returns (handle, close function)
             
-            # Navigate to share URL
-            print("Loading share URL...")
-            driver.get(url)
-            
-            # Wait for content to load
-            wait = WebDriverWait(driver, 60)
-            
-            # Look for content indicators
-            content_indicators = [
-                (By.CSS_SELECTOR, '[data-testid*="message"]'),
-                (By.CSS_SELECTOR, '[class*="message"]'),
-                (By.CSS_SELECTOR, 'main'),
-                (By.XPATH, "//*[string-length(normalize-space(text())) > 50]")
-            ]
-            
-            content_found = False
-            for by_method, selector in content_indicators:
-                try:
-                    element = wait.until(EC.presence_of_element_located((by_method, selector)))
-                    if element and len(element.text.strip()) > 20:
-                        content_found = True
-                        print(f"Content found with: {selector}")
-                        break
-                except:
-                    continue
-            
-            # Wait for loading to complete
-            print("Waiting for page to fully load...")
-            time.sleep(15)
-            
-            # Scroll to trigger lazy loading
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
-            
-            # Get HTML content
-            html_content = driver.page_source
-            print(f"Retrieved {len(html_content)} characters with undetected-chromedriver")
-            
-            # Check for Cloudflare challenges
-            cloudflare_indicators = [
-                'Just a moment...',
-                'checking if the site connection is secure',
-                'needs to review the security of your connection',
-                'Enable JavaScript and cookies to continue'
-            ]
-            
-            content_lower = html_content.lower()
-            for indicator in cloudflare_indicators:
-                if indicator.lower() in content_lower:
-                    return {
-                        'success': False,
-                        'error': f'Cloudflare challenge detected with undetected-chrome: {indicator}',
-                        'status_code': None,
-                        'html_content': html_content,
-                        'headers': {}
-                    }
-            
-            return {
-                'success': True,
-                'status_code': 200,
-                'html_content': html_content,
-                'headers': {},
-                'error': None
-            }
+        Returns:
+            The browser handle
+        """
+        if kind not in self._drivers:
+            self._drivers[kind] = launch()
+        return self._drivers[kind][0]
+    
+    def _fetch_cancelled(self, cancel: Optional[threading.Event]) -> bool:
+        """
+        Whether a browser fetch should give up on its page.
+        
+        Checked while holding the kind's driver lock, before the browser is
+        launched and on every render poll, so a fetch cancelled by close()
+        or by another method returning the page neither launches a browser
+        nor keeps one busy.
+        
+        Args:
+            cancel: Event the caller sets when it no longer wants the page
             
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Undetected ChromeDriver error: {str(e)}',
-                'status_code': None,
-                'html_content': None,
-                'headers': {}
-            }
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception as e:
-                    print(f"Error closing undetected browser (non-fatal): {e}")
+        Returns:
+            True if the scraper is closed or cancel is set
+        """
+        return self._closed or (cancel is not None and cancel.is_set())
+    
+    def _discard_driver(self, kind: str) -> None:
+        """Close and forget the browser of the given kind, if one is running."""
+        entry = self._drivers.pop(kind, None)
+        if entry is not None:
+            try:
+                entry[1]()
+            except Exception as e:
+                logger.warning("Error closing browser (non-fatal): %s", e)
     
-    def fetch_conversation_advanced(self, url: str) -> Dict[str, Any]:
+    def fetch_conversation_advanced(self, url: str) -> FetchResult:
         """
-        Advanced fetch with multiple bypass methods in fallback order.
-        Tries methods from most to least sophisticated.
+        Advanced fetch racing multiple bypass methods against each other.
+        
+        Cloudscraper, the cheapest method, starts first and gets a short head
+        start once its request is sent; if it has not succeeded by then the
+        browser methods start alongside it. The first success is returned,
+        so a page that defeats some methods costs the slowest winning method
+        rather than the sum of every method tried before it. Browser methods
+        still waiting for their browser when a method wins are skipped; ones
+        already loading stop at their next render poll and keep their browser
+        open for the next URL.
         
         Args:
             url: Claude.ai share URL
             
         Returns:
-            Dictionary containing response data
+            FetchResult with the page source
         """
-        methods = [
-            ('SeleniumBase UC Mode', self.fetch_conversation_with_seleniumbase_uc),
-            ('Undetected ChromeDriver', self.fetch_conversation_with_undetected_chrome),
-            ('Enhanced Browser (Selenium)', self.fetch_conversation_with_browser),
-            ('Cloudscraper', self.fetch_conversation)
-        ]
+        # Every method would reject it anyway - don't start the race
+        if not is_valid_claude_share_url(url):
+            return _error('Invalid Claude.ai share URL')
         
-        print(f"Trying {len(methods)} bypass methods...")
+        won = threading.Event()
+        request_sent = threading.Event()
         
-        for method_name, method_func in methods:
-            print(f"\nAttempting {method_name}...")
-            
+        def fetch_cheap() -> FetchResult:
+            """Fetch with cloudscraper, flagging when its request goes out."""
             try:
-                result = method_func(url)
-                
-                if result['success']:
-                    print(f"✅ {method_name} succeeded!")
-                    return result
-                else:
-                    print(f"❌ {method_name} failed: {result['error']}")
-                    
+                return self._fetch_share(url, request_sent=request_sent)
+            finally:
+                request_sent.set()  # Failed before sending - don't hold the browsers back
+        
+        def attempt(method_name: str, fetch: Callable[[], FetchResult]) -> Optional[FetchResult]:
+            """Run one bypass method, or skip it (None) once another has won."""
+            if won.is_set():
+                return None  # Another method already got the page
+            logger.info("Attempting %s...", method_name)
+            try:
+                return fetch()
             except Exception as e:
-                print(f"❌ {method_name} crashed: {str(e)}")
-                continue
+                logger.warning("❌ %s crashed: %s", method_name, truncate_text(str(e), _LOGGED_ERROR_LENGTH))
+                return None
         
-        return {
-            'success': False,
-            'error': 'All bypass methods failed',
-            'status_code': None,
-            'html_content': None,
-            'headers': {}
-        }
+        logger.info("Racing %d bypass methods...", len(_BROWSER_BYPASS_METHODS) + 1)
+        
+        executor = ThreadPoolExecutor(max_workers=len(_BROWSER_BYPASS_METHODS) + 1)
+        try:
+            cheap = executor.submit(attempt, 'Cloudscraper', fetch_cheap)
+            futures = {cheap: 'Cloudscraper'}
+            
+            # Give the cheap path a chance to succeed before launching browsers,
+            # timed from its request rather than its rate limit and warm-up -
+            # but never wait on those longer than one request timeout
+            request_sent.wait(self.timeout)
+            wait((cheap,), timeout=_BYPASS_HEAD_START)
+            cheap_result = cheap.result() if cheap.done() else None
+            if not (cheap_result and cheap_result.success):
+                for method_name, method_attr in _BROWSER_BYPASS_METHODS:
+                    fetch = partial(getattr(self, method_attr), url, cancel=won)
+                    futures[executor.submit(attempt, method_name, fetch)] = method_name
+            
+            for future in as_completed(futures):
+                method_name = futures[future]
+                result = future.result()
+                if result is None:
+                    continue
+                if result.success:
+                    won.set()
+                    logger.info("✅ %s succeeded!", method_name)
+                    return result
+                logger.info("❌ %s failed: %s", method_name, truncate_text(result.error, _LOGGED_ERROR_LENGTH))
+        finally:
+            won.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return _error('All bypass methods failed')
     
     def close(self) -> None:
-        """Close the session."""
+        """Close the session and any browsers left open between fetches."""
+        self._closed = True
+        for kind, lock in self._driver_locks.items():
+            with lock:
+                self._discard_driver(kind)
         if self.session:
+            self._save_cookies()
             self.session.close()
     
     def __enter__(self):
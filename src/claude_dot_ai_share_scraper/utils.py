@@ -4,11 +4,62 @@ Utility functions for Claude.ai share URL scraper.
 
 import re
 import hashlib
-from urllib.parse import urlparse
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Union
 
+# Fast non-cryptographic hashing (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
+# Default algorithm used by hash_content, recorded alongside stored hashes
+HASH_ALGORITHM = "xxh3" if XXHASH_AVAILABLE else "blake2b"
+
+# Desktop Chrome user agent sent by the browser-based fetchers
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+# strptime fallbacks for timestamps datetime.fromisoformat rejects
+_ISO_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d'
+)
+
+# Characters of a str encoded per hash update, so no full UTF-8 copy is made
+_HASH_CHUNK_CHARS = 64 * 1024
+
+# Share ID anywhere in a URL, and a full share URL with the ID captured
+_SHARE_ID_RE = re.compile(r'claude\.ai/share/([a-f0-9-]+)')
+_SHARE_URL_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*://claude\.ai/share/([a-f0-9-]+)')
+
+# sanitize_filename in one C-level pass for ASCII: whitespace becomes a
+# hyphen, anything but letters, digits, hyphens and underscores is dropped
+_FILENAME_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_')
+_FILENAME_TABLE = str.maketrans({
+    chr(code): '-' if chr(code).isspace() else None
+    for code in range(128)
+    if chr(code) not in _FILENAME_CHARS
+})
+
+# The same rules for the non-ASCII characters the table does not cover
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_FILENAME_CHARS_RE = re.compile(r'[^a-zA-Z0-9\-_]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+
+# Text sanitize_filename would return unchanged (apart from length)
+_SAFE_FILENAME_RE = re.compile(r'[a-zA-Z0-9_]+(?:-[a-zA-Z0-9_]+)*')
+
+
+@lru_cache(maxsize=1024)
 def extract_share_id(url: str) -> Optional[str]:
     """
     Extract the share ID from a Claude.ai share URL.
@@ -19,11 +70,11 @@ def extract_share_id(url: str) -> Optional[str]:
     Returns:
         Share ID string or None if URL is invalid
     """
-    pattern = r'claude\.ai/share/([a-f0-9-]+)'
-    match = re.search(pattern, url)
+    match = _SHARE_ID_RE.search(url)
     return match.group(1) if match else None
 
 
+@lru_cache(maxsize=1024)
 def is_valid_claude_share_url(url: str) -> bool:
     """
     Validate if a URL is a Claude.ai share URL.
@@ -34,15 +85,24 @@ def is_valid_claude_share_url(url: str) -> bool:
     Returns:
         True if valid Claude.ai share URL, False otherwise
     """
-    try:
-        parsed = urlparse(url)
-        return (
-            parsed.netloc == 'claude.ai' and 
-            parsed.path.startswith('/share/') and
-            extract_share_id(url) is not None
-        )
-    except Exception:
-        return False
+    return _SHARE_URL_RE.match(url) is not None
+
+
+def match_share_url(url: str) -> Optional[str]:
+    """
+    Validate a Claude.ai share URL and extract its share ID in one step.
+    
+    A single compiled-regex match replaces the is_valid_claude_share_url
+    plus extract_share_id pair, which matters when filtering long URL lists.
+    
+    Args:
+        url: URL to validate
+        
+    Returns:
+        Share ID string or None if URL is not a Claude.ai share URL
+    """
+    match = _SHARE_URL_RE.match(url)
+    return match.group(1) if match else None
 
 
 def sanitize_filename(text: str, max_length: int = 50) -> str:
@@ -56,16 +116,16 @@ def sanitize_filename(text: str, max_length: int = 50) -> str:
     Returns:
         Sanitized filename-safe string
     """
-    # Remove or replace invalid filename characters
-    text = re.sub(r'[<>:"/\\|?*]', '', text)
-    # Replace spaces and multiple whitespace with hyphens
-    text = re.sub(r'\s+', '-', text.strip())
-    # Remove non-alphanumeric except hyphens and underscores
-    text = re.sub(r'[^a-zA-Z0-9\-_]', '', text)
-    # Remove multiple consecutive hyphens
-    text = re.sub(r'-+', '-', text)
-    # Trim hyphens from start/end
-    text = text.strip('-')
+    # Already-safe names (share IDs, slugs) need no rewriting
+    if len(text) <= max_length and _SAFE_FILENAME_RE.fullmatch(text):
+        return text
+    
+    # Turn whitespace into hyphens and drop every other unsafe character
+    text = text.translate(_FILENAME_TABLE)
+    if not text.isascii():
+        text = _NON_FILENAME_CHARS_RE.sub('', _WHITESPACE_RE.sub('-', text))
+    # Collapse hyphen runs and trim hyphens from start/end
+    text = _HYPHEN_RUN_RE.sub('-', text).strip('-')
     
     # Truncate to max length
     if len(text) > max_length:
@@ -91,24 +151,53 @@ def generate_cache_dir_name(title: str, share_id: str, date: Optional[datetime]
     if date is None:
         date = datetime.now()
     
-    date_str = date.strftime('%Y-%m-%d')
+    # Direct field formatting skips strftime's format-string parsing
+    date_str = f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
     sanitized_title = sanitize_filename(title, max_length=30)
     short_id = share_id[:8] if share_id else 'unknown'
     
     return f"{date_str}_{sanitized_title}_{short_id}"
 
 
-def hash_content(content: str) -> str:
+def hash_content(content: Union[str, bytes], algorithm: str = HASH_ALGORITHM) -> str:
     """
-    Generate SHA-256 hash of content for duplicate detection.
+    Generate hash of content for duplicate detection.
+    
+    Uses 64-bit XXH3 by default when xxhash is installed, since the hash
+    is only a local integrity check. Otherwise it falls back to a 128-bit
+    BLAKE2b digest, which is faster than SHA-256 on most CPUs. Pass
+    algorithm="sha256" when a standard cryptographic digest is required.
+    
+    Strings are encoded and hashed in slices rather than encoded whole, so
+    hashing a large page does not hold a second copy of it in memory.
     
     Args:
-        content: Content to hash
+        content: Content to hash (str is encoded as UTF-8)
+        algorithm: Hash algorithm name ("xxh3", "blake2b" or "sha256")
         
     Returns:
-        Hex digest of SHA-256 hash
+        Hex digest of the content hash
+        
+    Raises:
+        ValueError: If the algorithm is unknown, or is "xxh3" without xxhash
     """
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if algorithm == "xxh3":
+        if not XXHASH_AVAILABLE:
+            raise ValueError("xxh3 hashing requires xxhash. Install with: uv add xxhash")
+        hasher = xxhash.xxh3_64()
+    elif algorithm == "blake2b":
+        hasher = hashlib.blake2b(digest_size=16)
+    elif algorithm == "sha256":
+        hasher = hashlib.sha256()
+    else:
+        raise ValueError(f"Unknown hash algorithm: {algorithm}")
+    
+    if isinstance(content, str):
+        for start in range(0, len(content), _HASH_CHUNK_CHARS):
+            hasher.update(content[start:start + _HASH_CHUNK_CHARS].encode('utf-8'))
+    else:
+        hasher.update(content)
+    return hasher.hexdigest()
 
 
 def get_user_agent() -> str:
@@ -118,11 +207,7 @@ def get_user_agent() -> str:
     Returns:
         User agent string
     """
-    return (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/131.0.0.0 Safari/537.36"
-    )
+    return USER_AGENT
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -148,23 +233,29 @@ def parse_iso_date(date_str: str) -> Optional[datetime]:
     """
     Parse ISO format date string to datetime object.
     
+    The C-level datetime.fromisoformat handles nearly every real timestamp;
+    the strptime formats are only tried for the few it rejects. It also
+    accepts other ISO 8601 forms such as basic ("20240101") and week
+    ("2024-W01-1") dates. A trailing 'Z' is dropped and any other UTC
+    offset is converted away, so the result is always a naive UTC value.
+    
     Args:
         date_str: ISO format date string
         
     Returns:
-        datetime object or None if parsing fails
+        Naive UTC datetime object or None if parsing fails
     """
     try:
-        # Handle various ISO formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%Y-%m-%dT%H:%M:%SZ', 
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d'
-        ]
-        
-        for fmt in formats:
+        parsed = datetime.fromisoformat(date_str[:-1] if date_str.endswith('Z') else date_str)
+    except (TypeError, ValueError, AttributeError):
+        pass
+    else:
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+    
+    try:
+        for fmt in _ISO_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError: